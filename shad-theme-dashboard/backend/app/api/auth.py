@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from ..core import get_db, get_password_hash, verify_password, create_access_token
-from ..core.security import decode_token
+from ..core import get_db, get_password_hash, create_access_token
+from ..core.database import SessionLocal
+from ..core.password_pool import PasswordPoolBusy, check_password, hash_password
+from ..core.security import needs_rehash
+from ..core.principal import Principal, principal_cache, token_key
+from .deps import get_current_principal, principal_from_user
+from ..core.config import settings
+from ..core.limiter import limiter
 from ..core.logging import setup_logging
 from ..models import User
 from ..schemas import UserCreate, UserResponse, Token, LoginRequest
 from datetime import timedelta
-from typing import Optional
 
 logger = setup_logging()
 
@@ -57,12 +63,64 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
 
+# Seconds clients should wait before retrying a login shed under load
+LOGIN_RETRY_AFTER = 2
+
+
+async def _upgrade_password_hash(user_id: int, old_hash: str, password: str):
+    """Re-hash a password at the current bcrypt cost after a successful login"""
+    try:
+        new_hash = await hash_password(password)
+    except PasswordPoolBusy:
+        return  # retried on a later login
+
+    def save() -> int:
+        db = SessionLocal()
+        try:
+            # Matching the old hash lets a concurrent password change win
+            updated = db.query(User).filter(
+                User.id == user_id, User.hashed_password == old_hash
+            ).update({User.hashed_password: new_hash}, synchronize_session=False)
+            db.commit()
+            return updated
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    try:
+        if await run_in_threadpool(save):
+            logger.info(f"Rehashed password for user {user_id} at the current bcrypt cost")
+    except Exception as e:
+        logger.error(f"Password rehash error for user {user_id}: {e}")
+
+
 @router.post("/login", response_model=Token)
-def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+@limiter.limit(lambda: settings.RATE_LIMIT_LOGIN)
+async def login(
+    request: Request,
+    login_data: LoginRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """Login and get access token"""
-    user = db.query(User).filter(User.username == login_data.username).first()
+    user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.username == login_data.username).first()
+    )
 
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    # bcrypt runs in the password pool, so this request holds no thread while it hashes
+    try:
+        password_ok = user is not None and await check_password(login_data.password, user.hashed_password)
+    except PasswordPoolBusy:
+        logger.warning("Login shed: password hashing queue is full")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many logins in progress, please retry shortly",
+            headers={"Retry-After": str(LOGIN_RETRY_AFTER)},
+        )
+
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -75,44 +133,20 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db)):
             detail="Inactive user"
         )
 
+    # Stored at another cost than BCRYPT_ROUNDS: upgrade after the response is sent
+    if needs_rehash(user.hashed_password):
+        background_tasks.add_task(_upgrade_password_hash, user.id, user.hashed_password, login_data.password)
+
     access_token = create_access_token(
         data={"sub": user.username, "user_id": user.id}
     )
+    # Compile the principal (department bitmask included) now, while the user is loaded
+    principal_cache.put(token_key(access_token), principal_from_user(user))
 
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user(
-    authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
-):
+def get_current_user(principal: Principal = Depends(get_current_principal)):
     """Get current user info from JWT token"""
-    # Get token from Authorization header
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated"
-        )
-    
-    token = authorization.replace("Bearer ", "")
-    payload = decode_token(token)
-    
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
-    
-    username = payload.get("sub")
-    if not username:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
-    
-    user = db.query(User).filter(User.username == username).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    return user
+    return principal.profile
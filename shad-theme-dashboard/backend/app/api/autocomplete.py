@@ -0,0 +1,33 @@
+"""
+Autocomplete Endpoints
+Prefix lookups for dropdowns, served from the in-memory typeahead index
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ..core.principal import Principal
+from ..core.typeahead import TYPEAHEAD_DEPARTMENTS, TYPEAHEAD_ENTITIES, indexes
+from ..schemas import TypeaheadMatch
+from .deps import ensure_department, get_access_principal
+
+router = APIRouter()
+
+
+@router.get("/{entity}", response_model=List[TypeaheadMatch])
+def autocomplete(
+    entity: str,
+    prefix: str = Query(default="", max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+    principal: Optional[Principal] = Depends(get_access_principal),
+):
+    """Names (or codes) starting with a prefix, case-insensitive, without a database round trip"""
+    index = indexes.get(entity)
+    if index is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown entity '{entity}', expected one of {', '.join(TYPEAHEAD_ENTITIES)}"
+        )
+    ensure_department(principal, TYPEAHEAD_DEPARTMENTS[entity])
+    return index.search(prefix, limit)
@@ -1,19 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import List, Optional
 from ..core import get_db
+from ..core.batch import batch_ids, fetch_by_ids
+from ..core.cache import CacheTTL, invalidate_cache
 from ..core.logging import setup_logging
+from ..core.pagination import CountMode, set_total_count
+from ..core.responses import ResponseFormat, columnar_response
+from ..core.search import apply_search
+from ..core.typeahead import notify_delete, notify_upsert
 from ..models import Buyer, ContactPerson, ShippingInfo, BankingInfo
 from ..schemas import (
     BuyerCreate, BuyerResponse, BuyerUpdate,
     ContactPersonCreate, ContactPersonResponse,
     ShippingInfoCreate, ShippingInfoResponse,
-    BankingInfoCreate, BankingInfoResponse
+    BankingInfoCreate, BankingInfoResponse,
+    BatchResult
 )
+from ..core.permissions import Department
+from .deps import require_department
 
 logger = setup_logging()
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_department(Department.CLIENT_INFO))])
 
 
 # Contact Person endpoints
@@ -94,6 +103,7 @@ def create_buyer(buyer_data: BuyerCreate, db: Session = Depends(get_db)):
         db.add(new_buyer)
         db.commit()
         db.refresh(new_buyer)
+        notify_upsert("buyers", new_buyer.id, new_buyer.buyer_name)
         return new_buyer
     except Exception as e:
         db.rollback()
@@ -103,15 +113,31 @@ def create_buyer(buyer_data: BuyerCreate, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[BuyerResponse])
 def get_buyers(
+    response: Response,
     skip: int = Query(default=0, ge=0, description="Number of records to skip"),
     limit: int = Query(default=10000, ge=1, le=10000, description="Max records per request"),
+    q: Optional[str] = Query(default=None, min_length=1, description="Fuzzy search on buyer name"),
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
     db: Session = Depends(get_db)
 ):
-    """Get all buyers"""
-    buyers = db.query(Buyer).order_by(Buyer.id.desc()).offset(skip).limit(limit).all()
+    """Get all buyers, or those matching a search term (best match first)"""
+    query = db.query(Buyer)
+    if q:
+        query = apply_search(query, q, Buyer.buyer_name)
+    set_total_count(response, query, table="buyers", ttl=CacheTTL.LOOKUP_DATA, filters={"q": q}, mode=count)
+    buyers = query.order_by(Buyer.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(buyers, BuyerResponse, response)
     return buyers
 
 
+@router.get("/batch", response_model=BatchResult[BuyerResponse])
+def get_buyers_batch(ids: List[int] = Depends(batch_ids), db: Session = Depends(get_db)):
+    """Get several buyers by ID in one request"""
+    return fetch_by_ids(db.query(Buyer), Buyer.id, ids)
+
+
 @router.get("/{buyer_id}", response_model=BuyerResponse)
 def get_buyer(buyer_id: int, db: Session = Depends(get_db)):
     """Get a specific buyer"""
@@ -134,6 +160,9 @@ def update_buyer(buyer_id: int, buyer_data: BuyerUpdate, db: Session = Depends(g
 
         db.commit()
         db.refresh(buyer)
+        # Style sheets (/samples/styles/{id}/full) embed buyer_name on their samples
+        invalidate_cache("style_sheet:*")
+        notify_upsert("buyers", buyer.id, buyer.buyer_name)
         return buyer
     except HTTPException:
         raise
@@ -153,6 +182,7 @@ def delete_buyer(buyer_id: int, db: Session = Depends(get_db)):
 
         db.delete(buyer)
         db.commit()
+        notify_delete("buyers", buyer_id)
         return None
     except Exception as e:
         db.rollback()
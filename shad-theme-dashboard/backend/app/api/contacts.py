@@ -5,10 +5,12 @@ from ..core import get_db
 from ..models import ContactPerson
 from ..schemas import ContactPersonCreate, ContactPersonResponse
 from ..core.logging import setup_logging
+from ..core.permissions import Department
+from .deps import require_department
 
 logger = setup_logging()
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_department(Department.CLIENT_INFO))])
 
 
 @router.post("/", response_model=ContactPersonResponse, status_code=status.HTTP_201_CREATED)
@@ -0,0 +1,125 @@
+"""
+Shared API Dependencies
+Authentication of bearer tokens into cached principals, and per-router
+department checks against the principal's precompiled bitmask
+"""
+
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.permissions import Department, department_mask
+from ..core.principal import Principal, principal_cache, token_key
+from ..core.security import decode_token
+from ..models import User
+from ..schemas import UserResponse
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def principal_from_user(user: User) -> Principal:
+    """Snapshot of a loaded user for the principal cache"""
+    department_access = list(user.department_access or [])
+    return Principal(
+        user_id=user.id,
+        username=user.username,
+        is_active=bool(user.is_active),
+        is_superuser=bool(user.is_superuser),
+        department_access=department_access,
+        department_mask=department_mask(department_access),
+        profile=UserResponse.model_validate(user).model_dump(mode="json"),
+    )
+
+
+def _load_principal(username: str) -> Optional[Principal]:
+    # Own short-lived session: a cache hit never checks out a connection
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == username).first()
+        return principal_from_user(user) if user else None
+    finally:
+        db.close()
+
+
+def get_current_principal(authorization: Optional[str] = Header(None)) -> Principal:
+    """Dependency resolving the bearer token to its user, from cache when possible"""
+    if not authorization or not authorization.startswith("Bearer "):
+        raise _unauthorized("Not authenticated")
+
+    token = authorization[len("Bearer "):]
+    key = token_key(token)
+    principal = principal_cache.get(key)
+
+    if principal is None:
+        # Signature and expiry are checked before caching; cached entries never outlive the token
+        payload = decode_token(token)
+        if not payload or not payload.get("sub"):
+            raise _unauthorized("Invalid token")
+        principal = _load_principal(payload["sub"])
+        if principal is None:
+            raise _unauthorized("User not found")
+        principal_cache.put(key, principal, token_exp=payload.get("exp"))
+
+    if not principal.is_active:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+    return principal
+
+
+def get_access_principal(authorization: Optional[str] = Header(None)) -> Optional[Principal]:
+    """
+    Dependency for routes spanning several departments: the caller's principal,
+    or None while ENFORCE_DEPARTMENT_ACCESS is off (everything allowed)
+    """
+    if not settings.ENFORCE_DEPARTMENT_ACCESS:
+        return None
+    return get_current_principal(authorization)
+
+
+def has_department(principal: Optional[Principal], department: Department) -> bool:
+    """Whether a principal from get_access_principal may see `department`"""
+    return principal is None or principal.can_access(department)
+
+
+def ensure_department(principal: Optional[Principal], department: Department):
+    """Raise 403 unless a principal from get_access_principal may see `department`"""
+    if not has_department(principal, department):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"No access to {department.id}"
+        )
+
+
+def require_superuser(authorization: Optional[str] = Header(None)) -> Optional[Principal]:
+    """
+    Route dependency restricting user administration to superusers; a no-op
+    while ENFORCE_DEPARTMENT_ACCESS is off. Department grants live on the
+    user row, so without it anyone could grant themselves every department.
+    """
+    principal = get_access_principal(authorization)
+    if principal is not None and not principal.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Superuser access required")
+    return principal
+
+
+def require_department(department: Department):
+    """
+    Router dependency restricting every route to users with `department`
+    (superusers pass); a no-op while ENFORCE_DEPARTMENT_ACCESS is off
+
+    Example:
+        router = APIRouter(dependencies=[Depends(require_department(Department.ORDERS))])
+    """
+    def check_department(authorization: Optional[str] = Header(None)) -> Optional[Principal]:
+        principal = get_access_principal(authorization)
+        ensure_department(principal, department)
+        return principal
+
+    return check_department
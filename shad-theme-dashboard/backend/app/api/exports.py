@@ -0,0 +1,67 @@
+"""
+Analytical Export Endpoints
+Download whole tables as Arrow IPC or Parquet files
+"""
+
+import os
+import tempfile
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+
+from ..core import get_db
+from ..core.config import settings
+from ..core.export import EXPORT_DEPARTMENTS, EXPORT_TABLES, DEFAULT_BATCH_SIZE, ExportFormat, write_export
+from ..core.limiter import limiter
+from ..core.logging import setup_logging
+from ..core.principal import Principal
+from .deps import ensure_department, get_access_principal, has_department
+
+logger = setup_logging()
+
+router = APIRouter()
+
+
+@router.get("/")
+def list_exportable_tables(principal: Optional[Principal] = Depends(get_access_principal)):
+    """List the tables available for columnar export"""
+    tables = [name for name in sorted(EXPORT_TABLES) if has_department(principal, EXPORT_DEPARTMENTS[name])]
+    return {"tables": tables, "formats": [f.value for f in ExportFormat]}
+
+
+@router.get("/{table_name}")
+@limiter.shared_limit(lambda: settings.RATE_LIMIT_EXPORT, scope="export")
+def export_table(
+    request: Request,
+    table_name: str,
+    format: ExportFormat = Query(default=ExportFormat.PARQUET, description="arrow (IPC file) or parquet"),
+    batch_size: int = Query(default=DEFAULT_BATCH_SIZE, ge=1000, le=500_000),
+    db: Session = Depends(get_db),
+    principal: Optional[Principal] = Depends(get_access_principal)
+):
+    """Export a whole table as an Arrow IPC or Parquet file"""
+    if table_name not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' is not exportable")
+    ensure_department(principal, EXPORT_DEPARTMENTS[table_name])
+
+    # Spool to a temp file so the DB cursor is released before the download starts
+    fd, path = tempfile.mkstemp(suffix=f".{format.extension}")
+    try:
+        with os.fdopen(fd, "wb") as sink:
+            write_export(db, table_name, sink, format, batch_size)
+    except Exception as e:
+        os.unlink(path)
+        logger.error(f"Export error for {table_name}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to export {table_name}")
+
+    filename = f"{table_name}_{datetime.utcnow():%Y%m%d_%H%M%S}.{format.extension}"
+    return FileResponse(
+        path,
+        media_type=format.media_type,
+        filename=filename,
+        background=BackgroundTask(os.unlink, path),
+    )
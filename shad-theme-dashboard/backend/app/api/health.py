@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from datetime import datetime
 from ..core.database import get_db
+from ..core.password_pool import password_pool_stats
 
 router = APIRouter()
 
@@ -48,7 +49,9 @@ async def health_check(db: Session = Depends(get_db)):
     except Exception:
         # Pool stats not critical - skip if unavailable
         pass
-    
+
+    health_status["checks"]["password_pool"] = password_pool_stats()
+
     return health_status
 
 
@@ -1,20 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..core.database import get_db
+from ..core.cache import CacheTTL
 from ..core.logging import setup_logging
+from ..core.pagination import CountMode, set_total_count
+from ..core.responses import ResponseFormat, columnar_response
+from ..core.search import apply_search
+from ..core.typeahead import notify_delete, notify_upsert
 from ..models.material import MaterialMaster
 from ..schemas.material import MaterialMasterCreate, MaterialMasterUpdate, MaterialMasterResponse
+from ..core.permissions import Department
+from .deps import require_department
 
 logger = setup_logging()
 
-router = APIRouter(prefix="/materials", tags=["materials"])
+router = APIRouter(prefix="/materials", tags=["materials"], dependencies=[Depends(require_department(Department.SAMPLE_DEPARTMENT))])
 
 
 @router.get("/", response_model=List[MaterialMasterResponse])
-def get_materials(db: Session = Depends(get_db)):
-    """Get all materials"""
-    materials = db.query(MaterialMaster).order_by(MaterialMaster.material_name).all()
+def get_materials(
+    response: Response,
+    q: Optional[str] = Query(default=None, min_length=1, description="Fuzzy search on material name"),
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
+    db: Session = Depends(get_db)
+):
+    """Get all materials, or those matching a search term (best match first)"""
+    query = db.query(MaterialMaster)
+    if q:
+        query = apply_search(query, q, MaterialMaster.material_name)
+    set_total_count(
+        response, query, table="material_master", ttl=CacheTTL.MATERIAL_DATA,
+        filters={"q": q}, mode=count
+    )
+    materials = query.order_by(MaterialMaster.material_name).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(materials, MaterialMasterResponse, response)
     return materials
 
 
@@ -45,6 +67,7 @@ def create_material(material: MaterialMasterCreate, db: Session = Depends(get_db
         db.add(db_material)
         db.commit()
         db.refresh(db_material)
+        notify_upsert("materials", db_material.id, db_material.material_name)
         return db_material
     except Exception as e:
         db.rollback()
@@ -82,6 +105,7 @@ def update_material(
     try:
         db.commit()
         db.refresh(db_material)
+        notify_upsert("materials", db_material.id, db_material.material_name)
         return db_material
     except Exception as e:
         db.rollback()
@@ -99,6 +123,7 @@ def delete_material(material_id: int, db: Session = Depends(get_db)):
     try:
         db.delete(db_material)
         db.commit()
+        notify_delete("materials", material_id)
         return {"message": "Material deleted successfully"}
     except Exception as e:
         db.rollback()
@@ -3,8 +3,10 @@ from sqlalchemy.orm import Session
 from typing import List
 from ..core import get_db
 from ..models import OperationMaster, SMVSettings, StyleSMV
+from ..core.permissions import Department
+from .deps import require_department
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_department(Department.SAMPLE_DEPARTMENT))])
 
 
 @router.get("/")
@@ -1,14 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, UploadFile, File
+from pydantic import ValidationError
+from sqlalchemy import Integer, String, any_, func, literal
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List, Optional
 from ..core import get_db
+from ..core.batch import batch_ids, fetch_by_ids
+from ..core.cache import CacheTTL
+from ..core.config import settings
+from ..core.limiter import limiter
 from ..core.logging import setup_logging
-from ..models import OrderManagement
-from ..schemas import OrderCreate, OrderUpdate, OrderResponse
+from ..core.pagination import CountMode, set_total_count
+from ..core.responses import ResponseFormat, columnar_response
+from ..core.spreadsheet import iter_spreadsheet_rows, validation_message
+from ..models import Buyer, OrderManagement, StyleSummary
+from ..schemas import OrderCreate, OrderUpdate, OrderResponse, OrderImportResult, BatchResult, BulkRowError
+from ..core.permissions import Department
+from .deps import require_department
 
 logger = setup_logging()
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_department(Department.ORDERS))])
+
+# Upper bound on PO lines accepted by a single import
+MAX_IMPORT_ROWS = 10000
+# Rows per multi-row INSERT statement
+IMPORT_BATCH_SIZE = 500
 
 
 @router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
@@ -40,12 +57,176 @@ def create_order(order_data: OrderCreate, db: Session = Depends(get_db)):
         )
 
 
+def _int_cell(value) -> Optional[int]:
+    """A whole-number cell (5, 5.0 or "5") as an int, else None"""
+    try:
+        number = float(str(value).strip())
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else None
+
+
+def _build_lookups(db: Session, rows: List[dict]):
+    """Buyer-name, buyer-id and style-code lookups for every value referenced by the file, one query each"""
+    buyer_names = {str(row["buyer_name"]).strip().lower() for row in rows if row.get("buyer_name")}
+    buyer_ids = {_int_cell(row["buyer_id"]) for row in rows if row.get("buyer_id") is not None} - {None}
+    style_codes = {str(row["style_id"]).strip() for row in rows if row.get("style_id") is not None}
+
+    buyers: Dict[str, List[int]] = {}
+    if buyer_names:
+        for name, buyer_id in db.query(func.lower(Buyer.buyer_name), Buyer.id).filter(
+            func.lower(Buyer.buyer_name) == any_(literal(list(buyer_names), ARRAY(String)))
+        ):
+            buyers.setdefault(name, []).append(buyer_id)
+
+    known_buyer_ids = set()
+    if buyer_ids:
+        known_buyer_ids = {buyer_id for (buyer_id,) in db.query(Buyer.id).filter(
+            Buyer.id == any_(literal(list(buyer_ids), ARRAY(Integer)))
+        )}
+
+    styles = {}
+    if style_codes:
+        for style in db.query(StyleSummary.style_id, StyleSummary.id, StyleSummary.style_name).filter(
+            StyleSummary.style_id == any_(literal(list(style_codes), ARRAY(String)))
+        ):
+            styles[style.style_id] = style
+    return buyers, known_buyer_ids, styles
+
+
+@router.post("/import", response_model=OrderImportResult)
+@limiter.shared_limit(lambda: settings.RATE_LIMIT_BULK, scope="bulk")
+def import_orders(
+    request: Request,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(default=False, description="Validate and reconcile without inserting"),
+    db: Session = Depends(get_db)
+):
+    """
+    Import purchase-order lines from a CSV or XLSX file
+
+    Columns match OrderCreate. Buyers may be given by buyer_name instead of
+    buyer_id, and style_id holds the style code (e.g. "ST-1001"); style_name
+    defaults to the style's name. Valid rows are inserted, the rest are
+    reported by sheet row along with quantity/value totals to reconcile
+    against the PO.
+    """
+    try:
+        lines = []
+        for row_number, row in iter_spreadsheet_rows(file.file, file.filename):
+            if len(lines) == MAX_IMPORT_ROWS:
+                raise HTTPException(status_code=400, detail=f"At most {MAX_IMPORT_ROWS} rows per import")
+            lines.append((row_number, row))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    buyers, known_buyer_ids, styles = _build_lookups(db, [row for _, row in lines])
+
+    errors: List[BulkRowError] = []
+    candidates = []  # (index, row_number, OrderCreate)
+    for index, (row_number, row) in enumerate(lines):
+        order_no = str(row["order_no"]).strip() if row.get("order_no") is not None else None
+
+        def reject(message: str):
+            errors.append(BulkRowError(index=index, row=row_number, key=order_no, error=message))
+
+        buyer_id = _int_cell(row["buyer_id"]) if row.get("buyer_id") is not None else None
+        if row.get("buyer_name"):
+            matches = buyers.get(str(row["buyer_name"]).strip().lower(), [])
+            if len(matches) != 1:
+                reject(f"Buyer '{row['buyer_name']}' {'is ambiguous' if matches else 'not found'}")
+                continue
+            if row.get("buyer_id") is not None and buyer_id != matches[0]:
+                reject(f"Buyer '{row['buyer_name']}' does not match buyer_id {row['buyer_id']}")
+                continue
+            row["buyer_id"] = matches[0]
+        elif buyer_id is not None and buyer_id not in known_buyer_ids:
+            reject(f"Buyer {buyer_id} not found")
+            continue
+
+        if row.get("style_id") is not None:
+            style = styles.get(str(row["style_id"]).strip())
+            if style is None:
+                reject(f"Style '{row['style_id']}' not found")
+                continue
+            row["style_id"] = style.id
+            row.setdefault("style_name", None)
+            row["style_name"] = row["style_name"] or style.style_name
+
+        row["order_no"] = order_no
+        try:
+            # Blank cells arrive as None; leave them out so schema defaults apply
+            candidates.append((index, row_number, OrderCreate.model_validate(
+                {k: v for k, v in row.items() if v is not None}
+            )))
+        except ValidationError as e:
+            reject(validation_message(e))
+
+    # order_no uniqueness: within the file, then against the table in one query
+    seen = set()
+    unique = []
+    for index, row_number, order in candidates:
+        if order.order_no in seen:
+            errors.append(BulkRowError(index=index, row=row_number, key=order.order_no, error="Duplicate order_no in file"))
+            continue
+        seen.add(order.order_no)
+        unique.append((index, row_number, order))
+
+    existing = set()
+    if seen:
+        existing = {order_no for (order_no,) in db.query(OrderManagement.order_no).filter(
+            OrderManagement.order_no == any_(literal(list(seen), ARRAY(String)))
+        )}
+
+    to_insert = []
+    for index, row_number, order in unique:
+        if order.order_no in existing:
+            errors.append(BulkRowError(index=index, row=row_number, key=order.order_no, error="order_no already exists"))
+            continue
+        to_insert.append((index, row_number, order))
+
+    created = {order.order_no for _, _, order in to_insert}
+    if not dry_run and to_insert:
+        try:
+            created = set()
+            values = [order.model_dump() for _, _, order in to_insert]
+            for start in range(0, len(values), IMPORT_BATCH_SIZE):
+                stmt = pg_insert(OrderManagement).values(values[start:start + IMPORT_BATCH_SIZE])
+                # Orders created concurrently since the check above are skipped, not failed
+                stmt = stmt.on_conflict_do_nothing(index_elements=[OrderManagement.order_no])
+                created.update(db.execute(stmt.returning(OrderManagement.order_no)).scalars())
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Order import error: {e}")
+            raise HTTPException(status_code=500, detail="Failed to import orders")
+
+        for index, row_number, order in to_insert:
+            if order.order_no not in created:
+                errors.append(BulkRowError(index=index, row=row_number, key=order.order_no, error="order_no already exists"))
+
+    imported = [order for _, _, order in to_insert if order.order_no in created]
+    errors.sort(key=lambda err: err.index)
+    return OrderImportResult(
+        dry_run=dry_run,
+        total_rows=len(lines),
+        created=len(imported),
+        failed=len(errors),
+        order_quantity=sum(order.order_quantity or 0 for order in imported),
+        total_value=sum(order.total_value or 0 for order in imported),
+        errors=errors,
+    )
+
+
 @router.get("/", response_model=List[OrderResponse])
 def get_orders(
+    response: Response,
     buyer_id: int = None,
     order_status: str = None,
     skip: int = 0,
     limit: int = 10000,
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
     db: Session = Depends(get_db)
 ):
     """Get all orders with optional filters"""
@@ -55,11 +236,23 @@ def get_orders(
         query = query.filter(OrderManagement.buyer_id == buyer_id)
     if order_status:
         query = query.filter(OrderManagement.order_status == order_status)
-    
+
+    set_total_count(
+        response, query, table="order_management", ttl=CacheTTL.TRANSACTIONAL,
+        filters={"buyer_id": buyer_id, "order_status": order_status}, mode=count
+    )
     orders = query.order_by(OrderManagement.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(orders, OrderResponse, response)
     return orders
 
 
+@router.get("/batch", response_model=BatchResult[OrderResponse])
+def get_orders_batch(ids: List[int] = Depends(batch_ids), db: Session = Depends(get_db)):
+    """Get several orders by ID in one request"""
+    return fetch_by_ids(db.query(OrderManagement), OrderManagement.id, ids)
+
+
 @router.get("/{order_id}", response_model=OrderResponse)
 def get_order(order_id: int, db: Session = Depends(get_db)):
     """Get a specific order by ID"""
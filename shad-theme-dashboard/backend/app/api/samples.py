@@ -1,24 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, UploadFile, File
+from pydantic import ValidationError
+from sqlalchemy import and_, func, insert, text, true, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import List, Optional
 from ..core import get_db
+from ..core.batch import batch_ids, fetch_by_ids
+from ..core.cache import CacheTTL, cache_response, invalidate_cache
+from ..core.config import settings
+from ..core.limiter import limiter
 from ..core.logging import setup_logging
-from ..models import Sample, SampleOperation, StyleSummary, StyleVariant, RequiredMaterial, SampleTNA, SamplePlan, OperationType, SMVCalculation
+from ..core.pagination import CountMode, set_total_count
+from ..core.responses import ResponseFormat, columnar_response
+from ..core.search import apply_search
+from ..core.typeahead import notify_delete, notify_upsert
+from ..core.spreadsheet import iter_spreadsheet_rows, validation_message
+from ..core.uom import convert_uom
+from ..models import Buyer, Sample, SampleOperation, StyleSummary, StyleVariant, VariantColorPart, RequiredMaterial, SampleTNA, SamplePlan, OperationType, SMVCalculation
 from ..schemas import (
-    SampleCreate, SampleResponse, SampleUpdate,
-    SampleOperationCreate, SampleOperationResponse,
-    StyleSummaryCreate, StyleSummaryResponse,
-    StyleVariantCreate, StyleVariantResponse, StyleVariantUpdate,
-    RequiredMaterialCreate, RequiredMaterialResponse, RequiredMaterialUpdate,
+    SampleCreate, SampleResponse, SampleUpdate, SampleBulkResult, SampleStatusTransition, SampleFacets, BulkRowError, BatchResult,
+    SampleOperationCreate, SampleOperationResponse, SampleOperationImportResult,
+    StyleSummaryCreate, StyleSummaryResponse, StyleSheetResponse, StyleCloneRequest,
+    StyleVariantCreate, StyleVariantResponse, StyleVariantUpdate, VariantMatrixRequest, VariantMatrixResult,
+    RequiredMaterialCreate, RequiredMaterialResponse, RequiredMaterialUpdate, RequiredMaterialLine,
     SampleTNACreate, SampleTNAResponse, SampleTNAUpdate,
     SamplePlanCreate, SamplePlanResponse,
     OperationTypeCreate, OperationTypeResponse,
     SMVCalculationCreate, SMVCalculationResponse
 )
+from ..core.permissions import Department
+from .deps import require_department
 
 logger = setup_logging()
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_department(Department.SAMPLE_DEPARTMENT))])
+
+# Submit status that sends a sample back for another round
+REMAKE_STATUS = "Reject and Request for remake"
+
+# Upper bound on rows accepted by a single bulk request
+MAX_BULK_ROWS = 5000
+# Rows per multi-row INSERT statement
+INSERT_CHUNK_SIZE = 1000
+
+
+def invalidate_style_sheet(*style_summary_ids):
+    """Drop the cached /styles/{id}/full documents of the given styles"""
+    for style_summary_id in set(style_summary_ids):
+        if style_summary_id is not None:
+            invalidate_cache(f"style_sheet:{style_summary_id}")
+
+
+def _variant_style_id(db: Session, variant_id: int):
+    """Style summary id of a variant, for invalidate_style_sheet"""
+    return db.query(StyleVariant.style_summary_id).filter(StyleVariant.id == variant_id).scalar()
+
+
+def _upsert_by_sample_piece(db: Session, model, rows: List[dict]) -> list:
+    """
+    Insert or update SamplePlan / SampleTNA rows keyed on (sample_id, piece_name)
+
+    Uses INSERT ... ON CONFLICT DO UPDATE against the unique
+    (sample_id, COALESCE(piece_name, '')) index. Does not commit.
+    """
+    # ON CONFLICT cannot touch the same row twice in one statement: last row wins
+    deduped = {}
+    for row in rows:
+        deduped[(row["sample_id"], row.get("piece_name") or "")] = row
+    rows = list(deduped.values())
+
+    conflict_key = [model.sample_id, func.coalesce(model.piece_name, "")]
+    results = []
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[start:start + INSERT_CHUNK_SIZE]
+        stmt = pg_insert(model).values(chunk)
+        updates = {name: stmt.excluded[name] for name in chunk[0] if name not in ("sample_id", "piece_name")}
+        updates["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=conflict_key, set_=updates).returning(model)
+        results.extend(db.scalars(stmt, execution_options={"populate_existing": True}).all())
+    return results
 
 
 # Style Summary endpoints
@@ -29,20 +89,40 @@ def create_style(style_data: StyleSummaryCreate, db: Session = Depends(get_db)):
     db.add(new_style)
     db.commit()
     db.refresh(new_style)
+    notify_upsert("styles", new_style.id, new_style.style_id, new_style.style_name)
     return new_style
 
 
 @router.get("/styles", response_model=List[StyleSummaryResponse])
 def get_styles(
+    response: Response,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=1000, ge=1, le=10000),
+    q: Optional[str] = Query(default=None, min_length=1, description="Fuzzy search on style name or style code"),
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
     db: Session = Depends(get_db)
 ):
-    """Get all style summaries (max 10000 per request)"""
-    styles = db.query(StyleSummary).order_by(StyleSummary.id.desc()).offset(skip).limit(limit).all()
+    """Get all style summaries (max 10000 per request), or those matching a search term"""
+    query = db.query(StyleSummary)
+    if q:
+        query = apply_search(query, q, StyleSummary.style_name, StyleSummary.style_id)
+    set_total_count(
+        response, query, table="style_summaries", ttl=CacheTTL.STYLE_DATA,
+        filters={"q": q}, mode=count
+    )
+    styles = query.order_by(StyleSummary.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(styles, StyleSummaryResponse, response)
     return styles
 
 
+@router.get("/styles/batch", response_model=BatchResult[StyleSummaryResponse])
+def get_styles_batch(ids: List[int] = Depends(batch_ids), db: Session = Depends(get_db)):
+    """Get several style summaries by ID in one request"""
+    return fetch_by_ids(db.query(StyleSummary), StyleSummary.id, ids)
+
+
 @router.get("/styles/{style_id}", response_model=StyleSummaryResponse)
 def get_style(style_id: int, db: Session = Depends(get_db)):
     """Get a specific style summary"""
@@ -52,6 +132,126 @@ def get_style(style_id: int, db: Session = Depends(get_db)):
     return style
 
 
+def _load_style_sheet(db: Session, style_id: int):
+    style = (
+        db.query(StyleSummary)
+        .options(
+            selectinload(StyleSummary.variants).selectinload(StyleVariant.color_parts),
+            selectinload(StyleSummary.variants).selectinload(StyleVariant.materials),
+            selectinload(StyleSummary.samples).selectinload(Sample.buyer),
+        )
+        .filter(StyleSummary.id == style_id)
+        .first()
+    )
+    if not style:
+        raise HTTPException(status_code=404, detail="Style not found")
+    # variant.style and sample.style resolve from the identity map, without queries
+    return StyleSheetResponse.model_validate(style)
+
+
+@router.get("/styles/{style_id}/full", response_model=StyleSheetResponse)
+@cache_response(key_prefix="style_sheet", ttl=CacheTTL.STYLE_DATA, key_builder=lambda style_id, **_: str(style_id))
+def get_style_sheet(style_id: int, db: Session = Depends(get_db)):
+    """Get a style with its variants, color parts, materials and samples in one document"""
+    return _load_style_sheet(db, style_id)
+
+
+# Columns a clone never copies: keys and timestamps are generated for the new rows
+_CLONE_SKIP_COLUMNS = {"id", "created_at", "updated_at"}
+
+
+def _clone_columns(model, alias: str, overrides: dict):
+    """INSERT column list and matching SELECT list copying `model` rows, with SQL overrides per column"""
+    names = [c.name for c in model.__table__.columns if c.name not in _CLONE_SKIP_COLUMNS]
+    return ", ".join(names), ", ".join(overrides.get(name, f"{alias}.{name}") for name in names)
+
+
+def _rebased_code(column: str) -> str:
+    """SQL swapping the source style code prefix of a variant code ({base}_{pieces}_{sizes}) for :new_code"""
+    return (
+        f"CASE WHEN left({column}, length(src.style_id)) = src.style_id"
+        f" THEN :new_code || substr({column}, length(src.style_id) + 1) ELSE :new_code END"
+    )
+
+
+@router.post("/styles/{style_id}/clone", response_model=StyleSheetResponse, status_code=status.HTTP_201_CREATED)
+def clone_style(style_id: int, clone_data: StyleCloneRequest, db: Session = Depends(get_db)):
+    """
+    Copy a style with all its variants, color parts and required materials
+
+    Runs as two INSERT ... SELECT statements in one transaction. New variant
+    ids are drawn from the sequence up front so color parts and materials
+    can be remapped in the same statement. Samples are not copied.
+    """
+    if db.query(StyleSummary.id).filter(StyleSummary.style_id == clone_data.style_id).first():
+        raise HTTPException(status_code=400, detail=f"Style '{clone_data.style_id}' already exists")
+    if clone_data.buyer_id is not None and not db.query(Buyer.id).filter(Buyer.id == clone_data.buyer_id).first():
+        raise HTTPException(status_code=400, detail=f"Buyer {clone_data.buyer_id} not found")
+
+    style_cols, style_select = _clone_columns(StyleSummary, "s", {
+        "style_id": ":new_code",
+        "style_name": "COALESCE(:style_name, s.style_name)",
+        "buyer_id": "COALESCE(:buyer_id, s.buyer_id)",
+    })
+    variant_cols, variant_select = _clone_columns(StyleVariant, "v", {
+        "style_summary_id": ":new_style_id", "style_name": ":style_name", "style_id": _rebased_code("v.style_id"),
+    })
+    color_cols, color_select = _clone_columns(VariantColorPart, "c", {"style_variant_id": "m.new_id"})
+    material_cols, material_select = _clone_columns(RequiredMaterial, "r", {
+        "style_variant_id": "m.new_id", "style_name": ":style_name", "style_id": _rebased_code("r.style_id"),
+    })
+
+    try:
+        new_style = db.execute(text(f"""
+            INSERT INTO style_summaries ({style_cols})
+            SELECT {style_select} FROM style_summaries s WHERE s.id = :source_id
+            RETURNING id, style_name
+        """), {
+            "source_id": style_id, "new_code": clone_data.style_id,
+            "style_name": clone_data.style_name, "buyer_id": clone_data.buyer_id,
+        }).first()
+        if new_style is None:
+            raise HTTPException(status_code=404, detail="Style not found")
+
+        db.execute(text(f"""
+            WITH variant_map AS (
+                SELECT id AS old_id, nextval(pg_get_serial_sequence('style_variants', 'id')) AS new_id
+                FROM style_variants WHERE style_summary_id = :source_id
+            ),
+            new_variants AS (
+                INSERT INTO style_variants (id, {variant_cols})
+                SELECT m.new_id, {variant_select}
+                FROM style_variants v JOIN variant_map m ON m.old_id = v.id
+                CROSS JOIN style_summaries src
+                WHERE src.id = :source_id
+            ),
+            new_colors AS (
+                INSERT INTO style_variant_colors ({color_cols})
+                SELECT {color_select}
+                FROM style_variant_colors c JOIN variant_map m ON m.old_id = c.style_variant_id
+            )
+            INSERT INTO required_materials ({material_cols})
+            SELECT {material_select}
+            FROM required_materials r JOIN variant_map m ON m.old_id = r.style_variant_id
+            CROSS JOIN style_summaries src
+            WHERE src.id = :source_id
+        """), {
+            "source_id": style_id, "new_style_id": new_style.id,
+            "new_code": clone_data.style_id, "style_name": new_style.style_name,
+        })
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Style clone error for style {style_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to clone style")
+
+    notify_upsert("styles", new_style.id, clone_data.style_id, new_style.style_name)
+    return _load_style_sheet(db, new_style.id)
+
+
 @router.put("/styles/{style_id}", response_model=StyleSummaryResponse)
 def update_style(style_id: int, style_data: StyleSummaryCreate, db: Session = Depends(get_db)):
     """Update a style summary"""
@@ -65,6 +265,8 @@ def update_style(style_id: int, style_data: StyleSummaryCreate, db: Session = De
 
         db.commit()
         db.refresh(style)
+        invalidate_style_sheet(style_id)
+        notify_upsert("styles", style.id, style.style_id, style.style_name)
         return style
     except HTTPException:
         raise
@@ -99,6 +301,8 @@ def delete_style(style_id: int, db: Session = Depends(get_db)):
 
     db.delete(style)
     db.commit()
+    invalidate_style_sheet(style_id)
+    notify_delete("styles", style_id)
     return None
 
 
@@ -113,6 +317,7 @@ def create_style_variant(variant_data: StyleVariantCreate, db: Session = Depends
         db.add(new_variant)
         db.commit()
         db.refresh(new_variant)
+        invalidate_style_sheet(new_variant.style_summary_id)
         return new_variant
     except Exception as e:
         db.rollback()
@@ -120,21 +325,128 @@ def create_style_variant(variant_data: StyleVariantCreate, db: Session = Depends
         raise HTTPException(status_code=500, detail="Failed to create style variant")
 
 
+def variant_display_name(style_name: str, colour_name: str, piece_name: Optional[str] = None) -> str:
+    """'Polo Shirt - Navy' or, for set pieces, 'Twin Set - Navy (Cardigan)'"""
+    name = f"{style_name} - {colour_name}"
+    return f"{name} ({piece_name})" if piece_name else name
+
+
+@router.post("/styles/{style_id}/variants/generate", response_model=VariantMatrixResult, status_code=status.HTTP_201_CREATED)
+def generate_style_variants(style_id: int, matrix: VariantMatrixRequest, db: Session = Depends(get_db)):
+    """
+    Create one variant per colourway x set piece in one transaction
+
+    The size run is stored on each variant's sizes array. Combinations that
+    already exist for the style are skipped. The variant code follows the
+    frontend's StyleID_pieces_sizes format.
+    """
+    style = db.query(StyleSummary).filter(StyleSummary.id == style_id).first()
+    if not style:
+        raise HTTPException(status_code=404, detail="Style not found")
+
+    pieces = list(dict.fromkeys(p.strip() for p in matrix.pieces if p.strip()))
+    if pieces and not style.is_set:
+        raise HTTPException(status_code=400, detail="Set pieces given for a style that is not a set")
+    if pieces and style.set_piece_count and len(pieces) != style.set_piece_count:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Style has {style.set_piece_count} set pieces, got {len(pieces)}"
+        )
+    if len(matrix.colourways) * max(len(pieces), 1) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} variants per request")
+
+    sizes = list(dict.fromkeys(matrix.sizes))
+    variant_code = f"{style.style_id}_{max(len(pieces), 1)}_{len(sizes)}"
+    existing = {
+        (colour_name, piece_name or "")
+        for colour_name, piece_name in db.query(StyleVariant.colour_name, StyleVariant.piece_name)
+        .filter(StyleVariant.style_summary_id == style_id)
+    }
+
+    rows, parts_by_key, skipped = [], {}, []
+    for colourway in matrix.colourways:
+        for piece_name in pieces or [None]:
+            display_name = variant_display_name(style.style_name, colourway.colour_name, piece_name)
+            key = (colourway.colour_name, piece_name or "")
+            if key in existing:
+                skipped.append(display_name)
+                continue
+            existing.add(key)
+            rows.append({
+                "style_summary_id": style.id,
+                "style_name": style.style_name,
+                "style_id": variant_code,
+                "colour_name": colourway.colour_name,
+                "colour_code": colourway.colour_code,
+                "is_multicolor": bool(colourway.color_parts),
+                "display_name": display_name,
+                "piece_name": piece_name,
+                "sizes": sizes,
+            })
+            parts_by_key[key] = colourway.color_parts or []
+
+    created_ids = []
+    try:
+        if rows:
+            stmt = pg_insert(StyleVariant).values(rows).returning(
+                StyleVariant.id, StyleVariant.colour_name, StyleVariant.piece_name
+            )
+            color_parts = []
+            for variant_id, colour_name, piece_name in db.execute(stmt):
+                created_ids.append(variant_id)
+                color_parts.extend(
+                    {"style_variant_id": variant_id, **part.model_dump()}
+                    for part in parts_by_key[(colour_name, piece_name or "")]
+                )
+            if color_parts:
+                db.execute(insert(VariantColorPart), color_parts)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Variant generation error for style {style_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to generate style variants")
+    invalidate_style_sheet(style_id)
+
+    created = (
+        db.query(StyleVariant)
+        .options(joinedload(StyleVariant.style), selectinload(StyleVariant.color_parts))
+        .filter(StyleVariant.id.in_(created_ids))
+        .order_by(StyleVariant.id)
+        .all()
+    ) if created_ids else []
+    return {"created": created, "skipped": skipped}
+
+
 @router.get("/style-variants", response_model=List[StyleVariantResponse])
 def get_style_variants(
+    response: Response,
     style_summary_id: int = None,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=1000, ge=1, le=10000),
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
     db: Session = Depends(get_db)
 ):
     """Get all style variants (max 10000 per request), optionally filtered by style summary"""
-    query = db.query(StyleVariant).options(joinedload(StyleVariant.style))
+    query = db.query(StyleVariant)
     if style_summary_id:
         query = query.filter(StyleVariant.style_summary_id == style_summary_id)
-    variants = query.order_by(StyleVariant.id.desc()).offset(skip).limit(limit).all()
+    set_total_count(
+        response, query, table="style_variants", ttl=CacheTTL.STYLE_DATA,
+        filters={"style_summary_id": style_summary_id}, mode=count
+    )
+    variants = query.options(joinedload(StyleVariant.style)).order_by(StyleVariant.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(variants, StyleVariantResponse, response)
     return variants
 
 
+@router.get("/style-variants/batch", response_model=BatchResult[StyleVariantResponse])
+def get_style_variants_batch(ids: List[int] = Depends(batch_ids), db: Session = Depends(get_db)):
+    """Get several style variants by ID in one request"""
+    return fetch_by_ids(db.query(StyleVariant).options(joinedload(StyleVariant.style)), StyleVariant.id, ids)
+
+
 @router.get("/style-variants/{variant_id}", response_model=StyleVariantResponse)
 def get_style_variant(variant_id: int, db: Session = Depends(get_db)):
     """Get a specific style variant"""
@@ -151,12 +463,14 @@ def update_style_variant(variant_id: int, variant_data: StyleVariantUpdate, db:
         variant = db.query(StyleVariant).filter(StyleVariant.id == variant_id).first()
         if not variant:
             raise HTTPException(status_code=404, detail="Style variant not found")
+        previous_style_id = variant.style_summary_id
 
         for key, value in variant_data.model_dump(exclude_unset=True).items():
             setattr(variant, key, value)
 
         db.commit()
         db.refresh(variant)
+        invalidate_style_sheet(previous_style_id, variant.style_summary_id)
         return variant
     except HTTPException:
         raise
@@ -172,12 +486,95 @@ def delete_style_variant(variant_id: int, db: Session = Depends(get_db)):
     variant = db.query(StyleVariant).filter(StyleVariant.id == variant_id).first()
     if not variant:
         raise HTTPException(status_code=404, detail="Style variant not found")
+    style_summary_id = variant.style_summary_id
 
     db.delete(variant)
     db.commit()
+    invalidate_style_sheet(style_summary_id)
     return None
 
 
+@router.get("/style-variants/{variant_id}/materials", response_model=List[RequiredMaterialResponse])
+def get_variant_materials(variant_id: int, db: Session = Depends(get_db)):
+    """Get the full material list of a style variant"""
+    if not db.query(StyleVariant.id).filter(StyleVariant.id == variant_id).first():
+        raise HTTPException(status_code=404, detail="Style variant not found")
+    return db.query(RequiredMaterial).filter(
+        RequiredMaterial.style_variant_id == variant_id
+    ).order_by(RequiredMaterial.id).all()
+
+
+@router.put("/style-variants/{variant_id}/materials", response_model=List[RequiredMaterialResponse])
+def replace_variant_materials(variant_id: int, lines: List[RequiredMaterialLine], db: Session = Depends(get_db)):
+    """
+    Replace a style variant's material list in one transaction
+
+    Rows with an id update that material (only if something changed), rows
+    without one are created, and existing materials missing from the list
+    are deleted. converted_consumption is computed from converted_uom.
+    """
+    if len(lines) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} materials per variant")
+
+    variant = db.query(StyleVariant).filter(StyleVariant.id == variant_id).first()
+    if not variant:
+        raise HTTPException(status_code=404, detail="Style variant not found")
+
+    existing = {m.id: m for m in db.query(RequiredMaterial).filter(RequiredMaterial.style_variant_id == variant_id)}
+
+    submitted_ids = [line.id for line in lines if line.id is not None]
+    if len(submitted_ids) != len(set(submitted_ids)):
+        raise HTTPException(status_code=400, detail="Duplicate material ids in request")
+    unknown = sorted(set(submitted_ids) - existing.keys())
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Materials {unknown} do not belong to style variant {variant_id}")
+
+    rows = []
+    for index, line in enumerate(lines):
+        values = line.model_dump(exclude={"id"})
+        values["converted_consumption"] = None
+        if values["converted_uom"] == values["uom"]:
+            values["converted_uom"] = None
+        if values["converted_uom"]:
+            values["converted_consumption"] = convert_uom(line.consumption_per_piece, line.uom, line.converted_uom)
+            if values["converted_consumption"] is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Row {index}: cannot convert {line.uom} to {line.converted_uom}"
+                )
+        rows.append((line.id, values))
+
+    try:
+        removed = existing.keys() - set(submitted_ids)
+        if removed:
+            db.query(RequiredMaterial).filter(RequiredMaterial.id.in_(removed)).delete(synchronize_session=False)
+
+        for material_id, values in rows:
+            if material_id is None:
+                db.add(RequiredMaterial(
+                    style_variant_id=variant_id,
+                    style_name=variant.style_name,
+                    style_id=variant.style_id,
+                    **values
+                ))
+                continue
+            material = existing[material_id]
+            for key, value in values.items():
+                if getattr(material, key) != value:
+                    setattr(material, key, value)
+
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Material list update error for variant {variant_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update material list")
+    invalidate_style_sheet(variant.style_summary_id)
+
+    return db.query(RequiredMaterial).filter(
+        RequiredMaterial.style_variant_id == variant_id
+    ).order_by(RequiredMaterial.id).all()
+
+
 # Required Material endpoints - MUST come before /{sample_id} route
 @router.post("/required-materials", response_model=RequiredMaterialResponse, status_code=status.HTTP_201_CREATED)
 def create_required_material(material_data: RequiredMaterialCreate, db: Session = Depends(get_db)):
@@ -187,6 +584,7 @@ def create_required_material(material_data: RequiredMaterialCreate, db: Session
         db.add(new_material)
         db.commit()
         db.refresh(new_material)
+        invalidate_style_sheet(_variant_style_id(db, new_material.style_variant_id))
         return new_material
     except Exception as e:
         db.rollback()
@@ -195,12 +593,26 @@ def create_required_material(material_data: RequiredMaterialCreate, db: Session
 
 
 @router.get("/required-materials", response_model=List[RequiredMaterialResponse])
-def get_required_materials(style_variant_id: int = None, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_required_materials(
+    response: Response,
+    style_variant_id: int = None,
+    skip: int = 0,
+    limit: int = 100,
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
+    db: Session = Depends(get_db)
+):
     """Get all required materials, optionally filtered by style variant"""
     query = db.query(RequiredMaterial)
     if style_variant_id:
         query = query.filter(RequiredMaterial.style_variant_id == style_variant_id)
+    set_total_count(
+        response, query, table="required_materials", ttl=CacheTTL.STYLE_DATA,
+        filters={"style_variant_id": style_variant_id}, mode=count
+    )
     materials = query.order_by(RequiredMaterial.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(materials, RequiredMaterialResponse, response)
     return materials
 
 
@@ -220,12 +632,16 @@ def update_required_material(material_id: int, material_data: RequiredMaterialUp
         material = db.query(RequiredMaterial).filter(RequiredMaterial.id == material_id).first()
         if not material:
             raise HTTPException(status_code=404, detail="Required material not found")
+        previous_variant_id = material.style_variant_id
 
         for key, value in material_data.model_dump(exclude_unset=True).items():
             setattr(material, key, value)
 
         db.commit()
         db.refresh(material)
+        invalidate_style_sheet(
+            _variant_style_id(db, previous_variant_id), _variant_style_id(db, material.style_variant_id)
+        )
         return material
     except HTTPException:
         raise
@@ -241,9 +657,11 @@ def delete_required_material(material_id: int, db: Session = Depends(get_db)):
     material = db.query(RequiredMaterial).filter(RequiredMaterial.id == material_id).first()
     if not material:
         raise HTTPException(status_code=404, detail="Required material not found")
+    style_summary_id = _variant_style_id(db, material.style_variant_id)
 
     db.delete(material)
     db.commit()
+    invalidate_style_sheet(style_summary_id)
     return None
 
 
@@ -258,10 +676,37 @@ def create_tna(tna_data: SampleTNACreate, db: Session = Depends(get_db)):
     return new_tna
 
 
+@router.post("/tna/bulk", response_model=List[SampleTNAResponse])
+@limiter.shared_limit(lambda: settings.RATE_LIMIT_BULK, scope="bulk")
+def upsert_tna_bulk(request: Request, tna_data: List[SampleTNACreate], db: Session = Depends(get_db)):
+    """Create or update a whole TNA grid in one statement, keyed on (sample_id, piece_name)"""
+    if len(tna_data) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} TNA rows per request")
+    try:
+        records = _upsert_by_sample_piece(db, SampleTNA, [row.model_dump() for row in tna_data])
+        db.commit()
+        return records
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Bulk TNA upsert error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to save TNA records")
+
+
 @router.get("/tna", response_model=List[SampleTNAResponse])
-def get_tna_records(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_tna_records(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
+    db: Session = Depends(get_db)
+):
     """Get all TNA records"""
-    tna_records = db.query(SampleTNA).order_by(SampleTNA.id.desc()).offset(skip).limit(limit).all()
+    query = db.query(SampleTNA)
+    set_total_count(response, query, table="sample_tna", ttl=CacheTTL.TRANSACTIONAL, mode=count)
+    tna_records = query.order_by(SampleTNA.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(tna_records, SampleTNAResponse, response)
     return tna_records
 
 
@@ -311,30 +756,48 @@ def get_tna_by_sample_id(sample_id: str, db: Session = Depends(get_db)):
 # Plan endpoints - MUST come before /{sample_id} route
 @router.post("/plan", response_model=SamplePlanResponse, status_code=status.HTTP_201_CREATED)
 def create_plan(plan_data: SamplePlanCreate, db: Session = Depends(get_db)):
-    """Create a new Plan record"""
-    # Check if plan already exists for this sample_id
-    existing_plan = db.query(SamplePlan).filter(SamplePlan.sample_id == plan_data.sample_id).first()
-
-    if existing_plan:
-        # Update existing plan
-        for key, value in plan_data.model_dump().items():
-            setattr(existing_plan, key, value)
+    """Create a Plan record, or update the existing one for this sample_id and piece"""
+    try:
+        [plan] = _upsert_by_sample_piece(db, SamplePlan, [plan_data.model_dump()])
         db.commit()
-        db.refresh(existing_plan)
-        return existing_plan
-    else:
-        # Create new plan
-        new_plan = SamplePlan(**plan_data.model_dump())
-        db.add(new_plan)
+        return plan
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Plan save error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to save plan")
+
+
+@router.post("/plan/bulk", response_model=List[SamplePlanResponse])
+@limiter.shared_limit(lambda: settings.RATE_LIMIT_BULK, scope="bulk")
+def upsert_plan_bulk(request: Request, plan_data: List[SamplePlanCreate], db: Session = Depends(get_db)):
+    """Create or update many Plan records in one statement, keyed on (sample_id, piece_name)"""
+    if len(plan_data) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} plan rows per request")
+    try:
+        records = _upsert_by_sample_piece(db, SamplePlan, [row.model_dump() for row in plan_data])
         db.commit()
-        db.refresh(new_plan)
-        return new_plan
+        return records
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Bulk plan upsert error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to save plan records")
 
 
 @router.get("/plan", response_model=List[SamplePlanResponse])
-def get_plan_records(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_plan_records(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
+    db: Session = Depends(get_db)
+):
     """Get all Plan records"""
-    plan_records = db.query(SamplePlan).order_by(SamplePlan.id.desc()).offset(skip).limit(limit).all()
+    query = db.query(SamplePlan)
+    set_total_count(response, query, table="sample_plan", ttl=CacheTTL.TRANSACTIONAL, mode=count)
+    plan_records = query.order_by(SamplePlan.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(plan_records, SamplePlanResponse, response)
     return plan_records
 
 
@@ -355,6 +818,7 @@ def create_operation_type(operation_data: OperationTypeCreate, db: Session = Dep
     db.add(new_operation)
     db.commit()
     db.refresh(new_operation)
+    notify_upsert("operation-types", new_operation.id, new_operation.operation_name)
     return new_operation
 
 
@@ -377,6 +841,7 @@ def update_operation_type(operation_id: int, operation_data: OperationTypeCreate
 
     db.commit()
     db.refresh(operation)
+    notify_upsert("operation-types", operation.id, operation.operation_name)
     return operation
 
 
@@ -389,6 +854,7 @@ def delete_operation_type(operation_id: int, db: Session = Depends(get_db)):
 
     db.delete(operation)
     db.commit()
+    notify_delete("operation-types", operation_id)
     return None
 
 
@@ -435,6 +901,74 @@ def create_sample_operation(operation_data: SampleOperationCreate, db: Session =
     return new_operation
 
 
+@router.post("/operations/import", response_model=SampleOperationImportResult)
+@limiter.shared_limit(lambda: settings.RATE_LIMIT_BULK, scope="bulk")
+def import_sample_operations(request: Request, file: UploadFile = File(...), db: Session = Depends(get_db)):
+    """
+    Import an operation breakdown from a CSV or XLSX file
+
+    Headers match SampleOperationCreate fields ("Number of Operation" works
+    too). sample_id may be the numeric sample id or the sample code.
+    total_duration is always computed here. Valid rows are inserted and
+    invalid ones are reported by sheet row.
+    """
+    try:
+        rows = []
+        for row_number, row in iter_spreadsheet_rows(file.file, file.filename):
+            if len(rows) == MAX_BULK_ROWS:
+                raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} rows per import")
+            rows.append((row_number, row))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Resolve sample codes (e.g. "S-1024") to ids with one query
+    codes = {
+        str(row["sample_id"]).strip() for _, row in rows
+        if row.get("sample_id") is not None and not str(row["sample_id"]).strip().isdigit()
+    }
+    code_to_id = dict(db.query(Sample.sample_id, Sample.id).filter(Sample.sample_id.in_(codes)).all()) if codes else {}
+
+    errors: List[BulkRowError] = []
+    valid = []
+    for index, (row_number, row) in enumerate(rows):
+        raw_sample = row.get("sample_id")
+        if raw_sample is not None and str(raw_sample).strip() in codes:
+            row["sample_id"] = code_to_id.get(str(raw_sample).strip(), raw_sample)
+        try:
+            # Blank cells arrive as None; leave them out so schema defaults apply
+            operation = SampleOperationCreate.model_validate({k: v for k, v in row.items() if v is not None})
+        except ValidationError as e:
+            errors.append(BulkRowError(index=index, row=row_number, key=str(raw_sample) if raw_sample is not None else None, error=validation_message(e)))
+            continue
+        valid.append((index, row_number, operation))
+
+    sample_ids = {operation.sample_id for _, _, operation in valid}
+    known_samples = {sid for (sid,) in db.query(Sample.id).filter(Sample.id.in_(sample_ids)).all()} if sample_ids else set()
+
+    values = []
+    for index, row_number, operation in valid:
+        if operation.sample_id not in known_samples:
+            errors.append(BulkRowError(index=index, row=row_number, key=str(operation.sample_id), error="Sample not found"))
+            continue
+        data = operation.model_dump()
+        data["total_duration"] = None
+        if data["duration"] is not None and data["number_of_operation"]:
+            data["total_duration"] = data["duration"] * data["number_of_operation"]
+        values.append(data)
+
+    try:
+        for start in range(0, len(values), INSERT_CHUNK_SIZE):
+            db.execute(insert(SampleOperation), values[start:start + INSERT_CHUNK_SIZE])
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Sample operation import error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to import sample operations")
+
+    errors.sort(key=lambda err: err.index)
+    return SampleOperationImportResult(total_rows=len(rows), created=len(values), errors=errors)
+
+
 @router.get("/operations", response_model=List[SampleOperationResponse])
 def get_sample_operations(sample_id: int = None, db: Session = Depends(get_db)):
     """Get all sample operations"""
@@ -493,6 +1027,7 @@ def create_sample(sample_data: SampleCreate, db: Session = Depends(get_db)):
         db.add(new_sample)
         db.commit()
         db.refresh(new_sample)
+        invalidate_style_sheet(new_sample.style_id)
         return new_sample
     except Exception as e:
         db.rollback()
@@ -500,21 +1035,230 @@ def create_sample(sample_data: SampleCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to create sample")
 
 
+@router.post("/bulk", response_model=SampleBulkResult, status_code=status.HTTP_201_CREATED)
+@limiter.shared_limit(lambda: settings.RATE_LIMIT_BULK, scope="bulk")
+def create_samples_bulk(request: Request, samples_data: List[SampleCreate], db: Session = Depends(get_db)):
+    """
+    Create many samples in one request
+
+    The batch is validated up front; rows with a duplicate sample_id or an
+    unknown buyer/style are reported in `errors` and the remaining rows are
+    inserted with multi-row INSERT ... RETURNING in a single transaction.
+    """
+    if len(samples_data) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} samples per request")
+
+    rows = [sample.model_dump() for sample in samples_data]
+    sample_ids = [row["sample_id"] for row in rows]
+    existing_ids = {sid for (sid,) in db.query(Sample.sample_id).filter(Sample.sample_id.in_(sample_ids))}
+    buyer_ids = {bid for (bid,) in db.query(Buyer.id).filter(Buyer.id.in_({row["buyer_id"] for row in rows}))}
+    style_ids = {sid for (sid,) in db.query(StyleSummary.id).filter(StyleSummary.id.in_({row["style_id"] for row in rows}))}
+
+    errors: List[BulkRowError] = []
+    valid_rows = []
+    seen = set()
+    for index, row in enumerate(rows):
+        error = None
+        if row["sample_id"] in existing_ids:
+            error = "sample_id already exists"
+        elif row["sample_id"] in seen:
+            error = "duplicate sample_id in batch"
+        elif row["buyer_id"] not in buyer_ids:
+            error = f"buyer {row['buyer_id']} not found"
+        elif row["style_id"] not in style_ids:
+            error = f"style {row['style_id']} not found"
+
+        if error:
+            errors.append(BulkRowError(index=index, key=row["sample_id"], error=error))
+        else:
+            seen.add(row["sample_id"])
+            valid_rows.append(row)
+
+    try:
+        inserted = {}
+        for start in range(0, len(valid_rows), INSERT_CHUNK_SIZE):
+            chunk = valid_rows[start:start + INSERT_CHUNK_SIZE]
+            stmt = (
+                pg_insert(Sample)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=[Sample.sample_id])
+                .returning(Sample.id, Sample.sample_id)
+            )
+            inserted.update({sid: pk for pk, sid in db.execute(stmt)})
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Bulk sample creation error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create samples")
+    invalidate_style_sheet(*{row["style_id"] for row in valid_rows if row["sample_id"] in inserted})
+
+    # Rows skipped by ON CONFLICT were created concurrently by another request
+    for index, row in enumerate(rows):
+        if row["sample_id"] in seen and row["sample_id"] not in inserted:
+            errors.append(BulkRowError(index=index, key=row["sample_id"], error="sample_id already exists"))
+    errors.sort(key=lambda e: e.index)
+
+    created = (
+        db.query(Sample)
+        .options(joinedload(Sample.buyer), joinedload(Sample.style))
+        .filter(Sample.id.in_(inserted.values()))
+        .all()
+    ) if inserted else []
+    created.sort(key=lambda sample: sample.id)
+    return {"created": created, "errors": errors}
+
+
+@router.post("/status-transitions", response_model=BatchResult[SampleResponse])
+def transition_sample_status(transition: SampleStatusTransition, db: Session = Depends(get_db)):
+    """Set submit_status on many samples with one UPDATE, bumping round on remake requests"""
+    if len(transition.ids) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} samples per request")
+
+    ids = list(dict.fromkeys(transition.ids))
+    values = {"submit_status": transition.submit_status}
+    if transition.submit_status == REMAKE_STATUS:
+        values["round"] = func.coalesce(Sample.round, 1) + 1
+
+    try:
+        stmt = (
+            update(Sample).where(Sample.id.in_(ids)).values(**values)
+            .returning(Sample)
+            .options(selectinload(Sample.buyer), selectinload(Sample.style))
+        )
+        updated = db.scalars(stmt, execution_options={"synchronize_session": False, "populate_existing": True}).all()
+        # Serialize the RETURNING rows now; commit expires them and would reload each one
+        by_id = {sample.id: SampleResponse.model_validate(sample) for sample in updated}
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Sample status transition error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update sample status")
+    invalidate_style_sheet(*{sample.style_id for sample in by_id.values()})
+
+    return BatchResult[SampleResponse](
+        items=[by_id[i] for i in ids if i in by_id],
+        missing=[i for i in ids if i not in by_id],
+    )
+
+
+class SampleFilters:
+    """
+    Sample board filters, shared by the list and its facet counts
+
+    Each field takes several values (?sample_type=Proto&sample_type=Fit);
+    values of one field are OR-ed, fields are AND-ed.
+    """
+
+    FACET_FIELDS = ("sample_type", "submit_status", "assigned_designer", "buyer_id", "gauge", "round")
+
+    def __init__(
+        self,
+        sample_type: Optional[List[str]] = Query(default=None),
+        submit_status: Optional[List[str]] = Query(default=None),
+        assigned_designer: Optional[List[str]] = Query(default=None),
+        buyer_id: Optional[List[int]] = Query(default=None),
+        gauge: Optional[List[str]] = Query(default=None),
+        round: Optional[List[int]] = Query(default=None),
+        q: Optional[str] = Query(default=None, min_length=1, description="Fuzzy search on sample ID"),
+    ):
+        self.values = {
+            "sample_type": sample_type, "submit_status": submit_status,
+            "assigned_designer": assigned_designer, "buyer_id": buyer_id,
+            "gauge": gauge, "round": round,
+        }
+        self.q = q
+
+    def conditions(self, exclude: Optional[str] = None) -> list:
+        """SQL conditions for the active facet filters, optionally leaving one field out"""
+        return [
+            getattr(Sample, field).in_(values)
+            for field, values in self.values.items()
+            if values and field != exclude
+        ]
+
+    def apply(self, query):
+        query = query.filter(*self.conditions())
+        if self.q:
+            query = apply_search(query, self.q, Sample.sample_id)
+        return query
+
+    def as_dict(self) -> dict:
+        """Active filters with sorted values, for count and cache keys"""
+        active = {field: sorted(values) for field, values in self.values.items() if values}
+        if self.q:
+            active["q"] = self.q
+        return active
+
+    def cache_key(self) -> str:
+        return "&".join(f"{field}={values}" for field, values in sorted(self.as_dict().items())) or "all"
+
+
 @router.get("/", response_model=List[SampleResponse])
 def get_samples(
-    buyer_id: int = None,
+    response: Response,
+    filters: SampleFilters = Depends(),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=10000, ge=1, le=10000),
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
     db: Session = Depends(get_db)
 ):
-    """Get all samples, optionally filtered by buyer"""
-    query = db.query(Sample)
-    if buyer_id:
-        query = query.filter(Sample.buyer_id == buyer_id)
+    """Get all samples, optionally filtered by any of the board filters and/or a search term"""
+    query = filters.apply(db.query(Sample))
+    set_total_count(
+        response, query, table="samples", ttl=CacheTTL.TRANSACTIONAL,
+        filters=filters.as_dict(), mode=count
+    )
     samples = query.options(joinedload(Sample.buyer), joinedload(Sample.style)).order_by(Sample.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(samples, SampleResponse, response)
     return samples
 
 
+@router.get("/facets", response_model=SampleFacets)
+@cache_response(key_prefix="sample_facets", ttl=CacheTTL.FACET_COUNTS, key_builder=lambda filters, **_: filters.cache_key())
+def get_sample_facets(filters: SampleFilters = Depends(), db: Session = Depends(get_db)):
+    """Per-value sample counts for each board filter, given the other active filters"""
+    # One scan with GROUPING SETS: a group per value of each field. Each field's
+    # count ignores its own filter, so unselected values still show how many
+    # samples picking them would add.
+    columns = {field: getattr(Sample, field) for field in SampleFilters.FACET_FIELDS}
+    query = db.query(
+        *columns.values(),
+        *[func.grouping(column).label(f"grouping_{field}") for field, column in columns.items()],
+        *[
+            func.count().filter(and_(true(), *filters.conditions(exclude=field))).label(f"count_{field}")
+            for field in columns
+        ],
+        func.count().filter(and_(true(), *filters.conditions())).label("count_all"),
+    )
+    if filters.q:
+        query = apply_search(query, filters.q, Sample.sample_id).order_by(None)
+    rows = query.group_by(func.grouping_sets(*columns.values())).all()
+
+    facets = {field: [] for field in columns}
+    total = 0
+    for row in rows:
+        field = next(f for f in columns if getattr(row, f"grouping_{f}") == 0)
+        if field == SampleFilters.FACET_FIELDS[0]:
+            # Each sample falls in exactly one group of any field, so summing one field gives the total
+            total += row.count_all
+        count = getattr(row, f"count_{field}")
+        if count:
+            facets[field].append({"value": getattr(row, field), "count": count})
+
+    for counts in facets.values():
+        counts.sort(key=lambda c: (-c["count"], str(c["value"])))
+    return {"total": total, "facets": facets}
+
+
+@router.get("/batch", response_model=BatchResult[SampleResponse])
+def get_samples_batch(ids: List[int] = Depends(batch_ids), db: Session = Depends(get_db)):
+    """Get several samples by numeric ID in one request"""
+    query = db.query(Sample).options(joinedload(Sample.buyer), joinedload(Sample.style))
+    return fetch_by_ids(query, Sample.id, ids)
+
+
 @router.get("/by-sample-id/{sample_id_str}", response_model=SampleResponse)
 def get_sample_by_sample_id(sample_id_str: str, db: Session = Depends(get_db)):
     """Get a sample by its sample_id string"""
@@ -533,9 +1277,10 @@ def update_sample(sample_id: int, sample_data: SampleUpdate, db: Session = Depen
         sample = db.query(Sample).filter(Sample.id == sample_id).first()
         if not sample:
             raise HTTPException(status_code=404, detail="Sample not found")
+        previous_style_id = sample.style_id
 
         # Handle submit status change - increment round if status is "Reject and Request for remake"
-        if sample_data.submit_status == "Reject and Request for remake":
+        if sample_data.submit_status == REMAKE_STATUS:
             sample.round += 1
 
         for key, value in sample_data.model_dump(exclude_unset=True).items():
@@ -543,7 +1288,8 @@ def update_sample(sample_id: int, sample_data: SampleUpdate, db: Session = Depen
 
         db.commit()
         db.refresh(sample)
-        
+        invalidate_style_sheet(previous_style_id, sample.style_id)
+
         # Add buyer_name and style_name from relationships (handled by model properties)
         return sample
     except HTTPException:
@@ -560,9 +1306,11 @@ def delete_sample(sample_id: int, db: Session = Depends(get_db)):
     sample = db.query(Sample).filter(Sample.id == sample_id).first()
     if not sample:
         raise HTTPException(status_code=404, detail="Sample not found")
+    style_summary_id = sample.style_id
 
     db.delete(sample)
     db.commit()
+    invalidate_style_sheet(style_summary_id)
     return None
 
 
@@ -0,0 +1,68 @@
+"""
+Search Endpoints
+Global top-bar search across entities, and full-text search across notes
+and descriptions
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+
+from ..core.database import get_db
+from ..core.fulltext import FULLTEXT_DEPARTMENTS, FULLTEXT_SOURCES, search_text
+from ..core.global_search import SEARCH_DEPARTMENTS, global_search
+from ..core.logging import setup_logging
+from ..core.principal import Principal
+from ..schemas import GlobalSearchResponse, TextSearchHit
+from .deps import get_access_principal, has_department
+
+router = APIRouter()
+logger = setup_logging()
+
+
+@router.get("/", response_model=GlobalSearchResponse)
+def search_everything(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(default=20, ge=1, le=50),
+    principal: Optional[Principal] = Depends(get_access_principal),
+):
+    """Buyers, suppliers, styles, samples, orders and materials matching a term, best first"""
+    # Sources outside the caller's departments are never queried
+    entities = [e for e, department in SEARCH_DEPARTMENTS.items() if has_department(principal, department)]
+    return global_search(q, limit, entities=entities)
+
+
+@router.get("/text", response_model=List[TextSearchHit])
+def full_text_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    entities: Optional[str] = Query(default=None, description="Comma-separated, e.g. samples,orders"),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    principal: Optional[Principal] = Depends(get_access_principal),
+):
+    """Ranked hits with highlighted snippets from sample, style, order and material notes"""
+    if entities:
+        selected = [e.strip() for e in entities.split(",") if e.strip()]
+        unknown = [e for e in selected if e not in FULLTEXT_SOURCES]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown entities {', '.join(unknown)}, expected {', '.join(FULLTEXT_SOURCES)}"
+            )
+    else:
+        selected = list(FULLTEXT_SOURCES)
+    selected = [e for e in selected if has_department(principal, FULLTEXT_DEPARTMENTS[e])]
+    if not selected:
+        return []
+
+    try:
+        return search_text(db, q, selected, limit)
+    except ProgrammingError as e:
+        db.rollback()
+        logger.error(f"Full-text search error: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Full-text search is not set up; run migrations/add_fulltext_search.py"
+        )
@@ -1,14 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..core import get_db
+from ..core.batch import batch_ids, fetch_by_ids
 from ..models import Supplier
-from ..schemas import SupplierCreate, SupplierResponse, SupplierUpdate
+from ..schemas import SupplierCreate, SupplierResponse, SupplierUpdate, BatchResult
+from ..core.cache import CacheTTL
 from ..core.logging import setup_logging
+from ..core.pagination import CountMode, set_total_count
+from ..core.responses import ResponseFormat, columnar_response
+from ..core.search import apply_search
+from ..core.permissions import Department
+from .deps import require_department
 
 logger = setup_logging()
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_department(Department.CLIENT_INFO))])
 
 
 @router.post("/", response_model=SupplierResponse, status_code=status.HTTP_201_CREATED)
@@ -27,12 +34,32 @@ def create_supplier(supplier_data: SupplierCreate, db: Session = Depends(get_db)
 
 
 @router.get("/", response_model=List[SupplierResponse])
-def get_suppliers(skip: int = 0, limit: int = 10000, db: Session = Depends(get_db)):
-    """Get all suppliers"""
-    suppliers = db.query(Supplier).order_by(Supplier.id.desc()).offset(skip).limit(limit).all()
+def get_suppliers(
+    response: Response,
+    skip: int = 0,
+    limit: int = 10000,
+    q: Optional[str] = Query(default=None, min_length=1, description="Fuzzy search on supplier name"),
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    format: ResponseFormat = Query(default=ResponseFormat.OBJECTS, description="objects, or columns for compact grid payloads"),
+    db: Session = Depends(get_db)
+):
+    """Get all suppliers, or those matching a search term (best match first)"""
+    query = db.query(Supplier)
+    if q:
+        query = apply_search(query, q, Supplier.supplier_name)
+    set_total_count(response, query, table="suppliers", ttl=CacheTTL.LOOKUP_DATA, filters={"q": q}, mode=count)
+    suppliers = query.order_by(Supplier.id.desc()).offset(skip).limit(limit).all()
+    if format is ResponseFormat.COLUMNS:
+        return columnar_response(suppliers, SupplierResponse, response)
     return suppliers
 
 
+@router.get("/batch", response_model=BatchResult[SupplierResponse])
+def get_suppliers_batch(ids: List[int] = Depends(batch_ids), db: Session = Depends(get_db)):
+    """Get several suppliers by ID in one request"""
+    return fetch_by_ids(db.query(Supplier), Supplier.id, ids)
+
+
 @router.get("/{supplier_id}", response_model=SupplierResponse)
 def get_supplier(supplier_id: int, db: Session = Depends(get_db)):
     """Get a specific supplier"""
@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List
 from ..core import get_db, get_password_hash
+from ..core.cache import CacheTTL
 from ..core.logging import setup_logging
+from ..core.pagination import CountMode, set_total_count
+from ..core.principal import invalidate_principal
 from ..models import User
 from ..schemas import UserCreate, UserResponse, UserUpdate
+from .deps import require_superuser
 
 logger = setup_logging()
 
 router = APIRouter()
 
 
-@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_superuser)])
 def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
     """Create a new user (Admin only)"""
     try:
@@ -55,9 +59,17 @@ def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[UserResponse])
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    count: CountMode = Query(default=CountMode.ESTIMATED, description="Total count mode for X-Total-Count"),
+    db: Session = Depends(get_db)
+):
     """Get all users"""
-    users = db.query(User).order_by(User.id.desc()).offset(skip).limit(limit).all()
+    query = db.query(User)
+    set_total_count(response, query, table="users", ttl=CacheTTL.USER_DATA, mode=count)
+    users = query.order_by(User.id.desc()).offset(skip).limit(limit).all()
     return users
 
 
@@ -70,7 +82,7 @@ def get_user(user_id: int, db: Session = Depends(get_db)):
     return user
 
 
-@router.put("/{user_id}", response_model=UserResponse)
+@router.put("/{user_id}", response_model=UserResponse, dependencies=[Depends(require_superuser)])
 def update_user(user_id: int, user_data: UserUpdate, db: Session = Depends(get_db)):
     """Update a user"""
     try:
@@ -94,6 +106,8 @@ def update_user(user_id: int, user_data: UserUpdate, db: Session = Depends(get_d
 
         db.commit()
         db.refresh(user)
+        # Tokens keep working, but must pick up the new flags and access list
+        invalidate_principal(user.id)
         return user
     except HTTPException:
         raise
@@ -106,7 +120,7 @@ def update_user(user_id: int, user_data: UserUpdate, db: Session = Depends(get_d
         )
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_superuser)])
 def delete_user(user_id: int, db: Session = Depends(get_db)):
     """Delete a user"""
     try:
@@ -123,6 +137,7 @@ def delete_user(user_id: int, db: Session = Depends(get_db)):
 
         db.delete(user)
         db.commit()
+        invalidate_principal(user_id)
         return None
     except HTTPException:
         raise
@@ -0,0 +1,56 @@
+"""
+Batch Lookups by ID
+Parses `?ids=1,2,3` and loads the rows with a single `WHERE id = ANY(:ids)`
+query, returning them in request order together with the ids not found
+"""
+
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Integer, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Query as ORMQuery
+
+# Upper bound on ids per batch request
+MAX_BATCH_IDS = 1000
+
+
+def batch_ids(ids: str = Query(..., description="Comma-separated ids, e.g. 1,2,3")) -> List[int]:
+    """Dependency parsing the `ids` query parameter; duplicates are dropped, order is kept"""
+    parsed: List[int] = []
+    seen = set()
+    for part in ids.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            value = int(part)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid id '{part}'")
+        if value not in seen:
+            seen.add(value)
+            parsed.append(value)
+
+    if not parsed:
+        raise HTTPException(status_code=400, detail="No ids given")
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    return parsed
+
+
+def fetch_by_ids(query: ORMQuery, column, ids: List[int]) -> Dict[str, List[Any]]:
+    """
+    Load the rows of `query` whose `column` is in `ids`
+
+    The ids are sent as one array parameter, so the statement text (and its
+    plan) is the same whatever the batch size.
+
+    Returns:
+        {"items": rows in the order of `ids`, "missing": ids with no row}
+    """
+    rows = query.filter(column == any_(literal(ids, ARRAY(Integer)))).all()
+    by_id = {getattr(row, column.key): row for row in rows}
+    return {
+        "items": [by_id[i] for i in ids if i in by_id],
+        "missing": [i for i in ids if i not in by_id],
+    }
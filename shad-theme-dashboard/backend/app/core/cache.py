@@ -12,8 +12,24 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
-# Redis client instance
+# Redis client instances
 redis_client: Optional[redis.Redis] = None
+redis_binary_client: Optional[redis.Redis] = None
+
+
+def _connect_redis(decode_responses: bool) -> redis.Redis:
+    client = redis.Redis(
+        host=getattr(settings, 'REDIS_HOST', 'redis'),
+        port=getattr(settings, 'REDIS_PORT', 6379),
+        db=getattr(settings, 'REDIS_DB', 0),
+        decode_responses=decode_responses,
+        socket_connect_timeout=5,
+        socket_keepalive=True,
+        health_check_interval=30
+    )
+    # Test connection
+    client.ping()
+    return client
 
 
 def get_redis_client() -> Optional[redis.Redis]:
@@ -22,17 +38,7 @@ def get_redis_client() -> Optional[redis.Redis]:
 
     if redis_client is None:
         try:
-            redis_client = redis.Redis(
-                host=getattr(settings, 'REDIS_HOST', 'redis'),
-                port=getattr(settings, 'REDIS_PORT', 6379),
-                db=getattr(settings, 'REDIS_DB', 0),
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_keepalive=True,
-                health_check_interval=30
-            )
-            # Test connection
-            redis_client.ping()
+            redis_client = _connect_redis(decode_responses=True)
             logger.info("✅ Redis connection established successfully")
         except Exception as e:
             logger.warning(f"⚠️  Redis connection failed: {e}. Caching disabled.")
@@ -41,6 +47,20 @@ def get_redis_client() -> Optional[redis.Redis]:
     return redis_client
 
 
+def get_redis_binary_client() -> Optional[redis.Redis]:
+    """Get or create a Redis client that returns raw bytes (for compressed bodies)"""
+    global redis_binary_client
+
+    if redis_binary_client is None:
+        try:
+            redis_binary_client = _connect_redis(decode_responses=False)
+        except Exception as e:
+            logger.warning(f"⚠️  Redis connection failed: {e}. Response cache disabled.")
+            redis_binary_client = None
+
+    return redis_binary_client
+
+
 def cache_response(
     key_prefix: str,
     ttl: int = 300,
@@ -241,3 +261,4 @@ class CacheTTL:
     MATERIAL_DATA = 1800       # 30 minutes - Material master (rarely changes)
     USER_DATA = 600            # 10 minutes - User profiles
     DASHBOARD_STATS = 120      # 2 minutes - Dashboard statistics
+    FACET_COUNTS = 30          # 30 seconds - Filter facet counts
@@ -22,12 +22,46 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
+    # bcrypt cost for new hashes (each step doubles login CPU). With BCRYPT_TARGET_MS set,
+    # startup measures this host and picks the highest cost hashing within that many ms.
+    # Stored hashes at another cost are rehashed on the user's next successful login.
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_TARGET_MS: Optional[int] = None
+
+    # Password hashing pool, per server worker: bcrypt processes, and the most
+    # hashes queued or running before logins are shed with 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 64
+
+    # Check router departments (app/api/deps.py:require_department) against the user's
+    # department_access; off until every client sends bearer tokens on data requests
+    ENFORCE_DEPARTMENT_ACCESS: bool = False
+
+    # Authenticated principal cache, per server worker (see app/core/principal.py)
+    AUTH_CACHE_TTL_SECONDS: int = 300
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+
     # Redis Cache
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
 
+    # Rate limiting (app/core/limiter.py): "<count>/<second|minute|hour>" per user, or per
+    # client IP when unauthenticated. Bulk and export limits are shared by all routes in
+    # the group. X-Real-IP is only honoured from RATE_LIMIT_TRUSTED_PROXIES (comma-separated
+    # addresses or CIDR ranges of the nginx proxy); by default the peer address is used, since
+    # the API port is also published directly and any client could set the header.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_STORAGE_URI: Optional[str] = None  # default: the Redis settings above
+    RATE_LIMIT_TRUSTED_PROXIES: str = ""
+    RATE_LIMIT_LOGIN: str = "60/minute"  # generous: a factory floor shares one NAT address
+    RATE_LIMIT_BULK: str = "30/minute"   # bulk creates and spreadsheet imports
+    RATE_LIMIT_EXPORT: str = "10/minute"  # full-table Arrow/Parquet exports
+
+    # Global search (GET /search): time budget per source before partial results are returned
+    GLOBAL_SEARCH_TIMEOUT_MS: int = 400
+
     # CORS - Allow all origins for internal ERP system
     # Set CORS_ORIGINS env variable to restrict (comma-separated list)
     CORS_ORIGINS: str = "*"
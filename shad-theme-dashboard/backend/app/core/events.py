@@ -0,0 +1,172 @@
+"""
+Change Notifications
+Publishes entity changes on a Redis pub/sub channel so every worker process
+can update its in-memory state; handlers in the publishing worker run
+immediately, and without Redis notifications stay local to the worker.
+Messages sent while a worker is not subscribed are lost, so resync hooks
+reload state after every (re)subscribe.
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from redis.client import PubSub
+
+from .cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+CHANGES_CHANNEL = "erp:changes"
+
+# Random per host start-up; combined with the pid it identifies this worker, even
+# when workers are forked from a preloaded master after import
+_INSTANCE = uuid.uuid4().hex[:8]
+
+# Seconds to wait before resubscribing after the Redis connection drops
+RECONNECT_DELAY = 5
+
+Handler = Callable[[str, Dict[str, Any]], None]
+
+_handlers: Dict[str, List[Handler]] = {}
+_resync_hooks: List[Callable[[], None]] = []
+_listener: Optional[threading.Thread] = None
+_stop = threading.Event()
+_first_attempt = threading.Event()
+_subscribed = threading.Event()
+
+
+def subscribe(entity: str, handler: Handler):
+    """Call handler(action, data) for every change to `entity`, from any worker"""
+    _handlers.setdefault(entity, []).append(handler)
+
+
+def add_resync_hook(hook: Callable[[], None]):
+    """Call hook() after each successful (re)subscribe, to reload state that may have missed changes"""
+    _resync_hooks.append(hook)
+
+
+def is_subscribed() -> bool:
+    """True while the listener receives other workers' changes"""
+    return _subscribed.is_set()
+
+
+def _resync():
+    for hook in _resync_hooks:
+        try:
+            hook()
+        except Exception as e:
+            logger.error(f"❌ Resync hook error: {e}")
+
+
+def _worker_id() -> str:
+    return f"{_INSTANCE}-{os.getpid()}"
+
+
+def _dispatch(entity: str, action: str, data: Dict[str, Any]):
+    for handler in _handlers.get(entity, []):
+        try:
+            handler(action, data)
+        except Exception as e:
+            logger.error(f"❌ Change handler error for {entity}/{action}: {e}")
+
+
+def publish_change(entity: str, action: str, data: Dict[str, Any]):
+    """
+    Announce a committed change to every worker
+
+    Args:
+        entity: What changed (e.g. "buyers")
+        action: Handler-defined action (e.g. "upsert", "delete")
+        data: JSON-serializable payload
+    """
+    _dispatch(entity, action, data)
+
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        message = {"entity": entity, "action": action, "data": data, "origin": _worker_id()}
+        client.publish(CHANGES_CHANNEL, json.dumps(message, default=str))
+    except Exception as e:
+        logger.error(f"❌ Change notification publish failed for {entity}: {e}")
+
+
+class _TrackingPubSub(PubSub):
+    # redis-py silently reconnects and resubscribes after a dropped connection;
+    # flag it, since anything published while disconnected was missed
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reconnected = threading.Event()
+
+    def on_connect(self, connection):
+        super().on_connect(connection)
+        self.reconnected.set()
+
+
+def _listen():
+    while not _stop.is_set():
+        client = get_redis_client()
+        if client is None:
+            _first_attempt.set()
+            _stop.wait(RECONNECT_DELAY)
+            continue
+        pubsub = _TrackingPubSub(client.connection_pool, ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(CHANGES_CHANNEL)
+            # Wait for the confirmation so nothing published after the resync is missed
+            pubsub.get_message(ignore_subscribe_messages=False, timeout=RECONNECT_DELAY)
+            _subscribed.set()
+            logger.info(f"📡 Listening for change notifications on {CHANGES_CHANNEL}")
+            pubsub.reconnected.clear()
+            _resync()
+            _first_attempt.set()
+            while not _stop.is_set():
+                if pubsub.reconnected.is_set():
+                    pubsub.reconnected.clear()
+                    logger.info(f"📡 Resubscribed to {CHANGES_CHANNEL}, resyncing")
+                    _resync()
+                message = pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                payload = json.loads(message["data"])
+                if payload.get("origin") != _worker_id():
+                    _dispatch(payload["entity"], payload["action"], payload["data"])
+        except Exception as e:
+            _subscribed.clear()
+            _first_attempt.set()
+            logger.error(f"❌ Change listener error, reconnecting in {RECONNECT_DELAY}s: {e}")
+            _stop.wait(RECONNECT_DELAY)
+        finally:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+
+def start_listener(timeout: float = 10.0):
+    """
+    Start the background thread receiving other workers' changes (idempotent)
+
+    Waits up to `timeout` seconds for the first subscribe attempt, so on
+    return is_subscribed() tells whether the resync hooks have already run.
+    """
+    global _listener
+    if _listener is not None and _listener.is_alive():
+        return
+    _stop.clear()
+    _first_attempt.clear()
+    _listener = threading.Thread(target=_listen, name="change-listener", daemon=True)
+    _listener.start()
+    _first_attempt.wait(timeout)
+
+
+def stop_listener(timeout: float = 2.0):
+    """Stop the listener thread"""
+    _stop.set()
+    _subscribed.clear()
+    if _listener is not None:
+        _listener.join(timeout)
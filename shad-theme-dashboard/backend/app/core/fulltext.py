@@ -0,0 +1,83 @@
+"""
+Full-Text Search
+Ranked search over free-text notes and descriptions (samples, styles, orders,
+required materials) using trigger-maintained tsvector columns and GIN indexes
+created by migrations/add_fulltext_search.py
+"""
+
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .permissions import Department
+
+# Text search configuration: English stemming, so "yarns" matches "yarn"
+TS_CONFIG = "english"
+
+# Name of the tsvector column added to every searchable table
+VECTOR_COLUMN = "search_vector"
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, MaxFragments=2"
+
+
+class FullTextSource(NamedTuple):
+    table: str
+    label: str                            # column shown as the hit's title
+    columns: Sequence[Tuple[str, str]]    # (text column, weight A-D)
+
+
+FULLTEXT_SOURCES: Dict[str, FullTextSource] = {
+    "samples": FullTextSource("samples", "sample_id", (("sample_description", "A"), ("notes", "B"))),
+    "styles": FullTextSource("style_summaries", "style_name", (("style_description", "A"),)),
+    "orders": FullTextSource("order_management", "order_no", (("note", "A"),)),
+    "materials": FullTextSource("required_materials", "material", (("remarks", "A"),)),
+}
+
+# Department whose users may see each source's hits
+FULLTEXT_DEPARTMENTS: Dict[str, Department] = {
+    "samples": Department.SAMPLE_DEPARTMENT,
+    "styles": Department.SAMPLE_DEPARTMENT,
+    "orders": Department.ORDERS,
+    "materials": Department.SAMPLE_DEPARTMENT,
+}
+
+
+def vector_sql(source: FullTextSource, row: str = "") -> str:
+    """SQL expression computing the weighted tsvector of a row (`row` is e.g. "NEW." in a trigger)"""
+    return " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({row}{column}, '')), '{weight}')"
+        for column, weight in source.columns
+    )
+
+
+def search_text(db: Session, q: str, entities: Sequence[str], limit: int) -> List[dict]:
+    """
+    Best `limit` hits for a web-style query ("recycled yarn", "soft -wool",
+    '"hand feel"') across `entities`, highest rank first
+
+    Each entity is ranked and limited on its own, and the snippets are only
+    highlighted for the rows that survive, all in one statement.
+    """
+    parts = []
+    for entity in entities:
+        source = FULLTEXT_SOURCES[entity]
+        body = ", ".join(column for column, _ in source.columns)
+        parts.append(f"""
+            (SELECT '{entity}' AS entity, id, {source.label}::text AS label,
+                    concat_ws(' … ', {body}) AS body,
+                    ts_rank({VECTOR_COLUMN}, query) AS rank
+             FROM {source.table}, websearch_to_tsquery('{TS_CONFIG}', :q) AS query
+             WHERE {VECTOR_COLUMN} @@ query
+             ORDER BY rank DESC
+             LIMIT :limit)
+        """)
+
+    rows = db.execute(text(f"""
+        SELECT hit.entity, hit.id, hit.label, hit.rank,
+               ts_headline('{TS_CONFIG}', hit.body, websearch_to_tsquery('{TS_CONFIG}', :q), :options) AS snippet
+        FROM ({" UNION ALL ".join(parts)}) AS hit
+        ORDER BY hit.rank DESC
+        LIMIT :limit
+    """), {"q": q, "limit": limit, "options": HEADLINE_OPTIONS}).mappings().all()
+    return [dict(row) for row in rows]
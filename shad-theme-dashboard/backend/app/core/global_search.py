@@ -0,0 +1,127 @@
+"""
+Global Search
+Fans one search term out to buyers, suppliers, styles, samples, orders and
+materials concurrently, each on its own connection with a statement
+timeout, and merges the hits by trigram similarity. Sources that miss the
+time budget are reported instead of holding up the response.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+from .config import settings
+from .database import SessionLocal
+from .permissions import Department
+from .search import apply_search, search_rank
+
+logger = logging.getLogger(__name__)
+
+# Threads shared by all global searches; a search needs one per source
+SEARCH_WORKERS = 24
+
+_executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="global-search")
+
+
+class SearchSource(NamedTuple):
+    model: Any
+    label: Any                  # column shown as the hit's title
+    detail: Any                 # secondary column (company, code, type)
+    columns: Sequence[Any]      # columns matched against the term
+
+
+# Department whose users may see each source's hits
+SEARCH_DEPARTMENTS: Dict[str, Department] = {
+    "buyers": Department.CLIENT_INFO,
+    "suppliers": Department.CLIENT_INFO,
+    "styles": Department.SAMPLE_DEPARTMENT,
+    "samples": Department.SAMPLE_DEPARTMENT,
+    "orders": Department.ORDERS,
+    "materials": Department.SAMPLE_DEPARTMENT,
+}
+
+
+def _sources() -> Dict[str, SearchSource]:
+    # Imported lazily: models import the core package
+    from ..models import Buyer, MaterialMaster, OrderManagement, Sample, StyleSummary, Supplier
+    return {
+        "buyers": SearchSource(Buyer, Buyer.buyer_name, Buyer.company_name, [Buyer.buyer_name]),
+        "suppliers": SearchSource(Supplier, Supplier.supplier_name, Supplier.company_name, [Supplier.supplier_name]),
+        "styles": SearchSource(StyleSummary, StyleSummary.style_name, StyleSummary.style_id,
+                               [StyleSummary.style_id, StyleSummary.style_name]),
+        "samples": SearchSource(Sample, Sample.sample_id, Sample.sample_type, [Sample.sample_id]),
+        "orders": SearchSource(OrderManagement, OrderManagement.order_no, OrderManagement.style_name,
+                               [OrderManagement.order_no]),
+        "materials": SearchSource(MaterialMaster, MaterialMaster.material_name, MaterialMaster.uom,
+                                  [MaterialMaster.material_name]),
+    }
+
+
+def _search_source(entity: str, source: SearchSource, q: str, limit: int, timeout_ms: int) -> Tuple[List[dict], int]:
+    started = time.monotonic()
+    db = SessionLocal()
+    try:
+        # The server cancels the query at the budget, so a slow source frees its connection
+        db.execute(text(f"SET LOCAL statement_timeout = {int(timeout_ms)}"))
+        query = db.query(
+            source.model.id,
+            source.label.label("label"),
+            source.detail.label("detail"),
+            search_rank(q, *source.columns).label("score"),
+        )
+        rows = apply_search(query, q, *source.columns).limit(limit).all()
+        hits = [
+            {"entity": entity, "id": row.id, "label": row.label, "detail": row.detail, "score": float(row.score or 0)}
+            for row in rows
+        ]
+        return hits, round((time.monotonic() - started) * 1000)
+    finally:
+        db.rollback()
+        db.close()
+
+
+def global_search(
+    q: str, limit: int = 20, timeout_ms: int = None, entities: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Search every entity at once
+
+    Args:
+        q: Search term
+        limit: Hits kept per source and in the merged list
+        timeout_ms: Budget for each source (default: settings.GLOBAL_SEARCH_TIMEOUT_MS)
+        entities: Sources to search (default: all); the rest are not queried
+
+    Returns:
+        {"items": merged hits, best first,
+         "sources": {entity: {"status": "ok" | "timeout" | "error", "count", "elapsed_ms"}}}
+    """
+    timeout_ms = timeout_ms or settings.GLOBAL_SEARCH_TIMEOUT_MS
+    futures = {
+        entity: _executor.submit(_search_source, entity, source, q, limit, timeout_ms)
+        for entity, source in _sources().items()
+        if entities is None or entity in entities
+    }
+    wait(futures.values(), timeout=timeout_ms / 1000)
+
+    items: List[dict] = []
+    sources: Dict[str, Dict[str, Any]] = {}
+    for entity, future in futures.items():
+        if not future.done():
+            future.cancel()  # no-op once running; the statement timeout ends it
+            sources[entity] = {"status": "timeout", "count": 0, "elapsed_ms": timeout_ms}
+            continue
+        try:
+            hits, elapsed_ms = future.result()
+        except Exception as e:
+            logger.error(f"❌ Global search failed for {entity}: {e}")
+            sources[entity] = {"status": "error", "count": 0, "elapsed_ms": None}
+            continue
+        items.extend(hits)
+        sources[entity] = {"status": "ok", "count": len(hits), "elapsed_ms": elapsed_ms}
+
+    items.sort(key=lambda hit: hit["score"], reverse=True)
+    return {"items": items[:limit], "sources": sources}
@@ -1,14 +1,76 @@
 """
 Rate Limiting Configuration
+Limits are counted in Redis so they hold across all workers (falling back to
+per-worker memory while Redis is unreachable) and are keyed by user id for
+authenticated requests, by client IP otherwise. Limits are set per route
+group in settings (RATE_LIMIT_LOGIN, RATE_LIMIT_BULK, RATE_LIMIT_EXPORT).
 """
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Tuple
+
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from .config import settings
+from .security import decode_token
+
+
+def _storage_uri() -> str:
+    if settings.RATE_LIMIT_STORAGE_URI:
+        return settings.RATE_LIMIT_STORAGE_URI
+    auth = f":{settings.REDIS_PASSWORD}@" if settings.REDIS_PASSWORD else ""
+    return f"redis://{auth}{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+
+
+@lru_cache(maxsize=8)
+def _trusted_networks(proxies: str) -> Tuple[IPv4Network | IPv6Network, ...]:
+    return tuple(ip_network(p.strip(), strict=False) for p in proxies.split(",") if p.strip())
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        peer = ip_address(address)
+    except ValueError:
+        return False
+    return any(peer in network for network in _trusted_networks(settings.RATE_LIMIT_TRUSTED_PROXIES))
+
+
+def client_ip(request: Request) -> str:
+    """Client address, taken from nginx's X-Real-IP only when the peer is a trusted proxy"""
+    remote = get_remote_address(request)
+    real_ip = request.headers.get("x-real-ip")
+    if real_ip and _is_trusted_proxy(remote):
+        return real_ip
+    return remote
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Bucket for a request: "user:<id>" for a valid bearer token, else "ip:<address>"
+
+    Only the token signature is checked (no DB lookup); a forged token
+    falls back to the IP bucket.
+    """
+    authorization = request.headers.get("authorization", "")
+    if authorization.startswith("Bearer "):
+        payload = decode_token(authorization[len("Bearer "):])
+        if payload and payload.get("user_id"):
+            return f"user:{payload['user_id']}"
+    return f"ip:{client_ip(request)}"
+
+
 # Create limiter instance
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(
+    key_func=rate_limit_key,
+    storage_uri=_storage_uri(),
+    in_memory_fallback_enabled=True,
+    key_prefix="ratelimit",
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
     """
@@ -17,4 +79,5 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
     return JSONResponse(
         status_code=429,
         content={"detail": f"Rate limit exceeded: {exc.detail}"},
+        headers={"Retry-After": str(exc.limit.limit.get_expiry())},
     )
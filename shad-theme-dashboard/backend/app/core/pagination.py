@@ -0,0 +1,100 @@
+"""
+Total Count Support for Collection Endpoints
+Sets the X-Total-Count header using planner estimates for unfiltered
+tables and exact counts for filtered queries, cached per filter combination
+"""
+
+import logging
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from sqlalchemy import text
+from sqlalchemy.orm import Query
+
+from .cache import _get_from_cache, _set_in_cache
+
+logger = logging.getLogger(__name__)
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+COUNT_MODE_HEADER = "X-Total-Count-Mode"
+
+# Below this many rows an exact count is cheap, and more useful than an estimate
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+class CountMode(str, Enum):
+    """How the total count of a collection is computed"""
+    ESTIMATED = "estimated"  # planner statistics when unfiltered, exact otherwise
+    EXACT = "exact"          # always COUNT(*)
+    NONE = "none"            # skip counting entirely
+
+
+def _is_filtered(filters: Dict[str, Any]) -> bool:
+    return any(value not in (None, "", [], ()) for value in filters.values())
+
+
+def _count_cache_key(table: str, mode: str, filters: Dict[str, Any]) -> str:
+    parts = [f"{k}={v}" for k, v in sorted(filters.items()) if v not in (None, "", [], ())]
+    return ":".join(["count", table, mode, *parts])
+
+
+def _estimated_count(query: Query, table: str) -> Optional[int]:
+    """Row estimate from pg_class; None if the table has never been analyzed"""
+    estimate = query.session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table}
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def set_total_count(
+    response: Response,
+    query: Query,
+    *,
+    table: str,
+    ttl: int,
+    filters: Optional[Dict[str, Any]] = None,
+    mode: CountMode = CountMode.ESTIMATED,
+) -> Optional[int]:
+    """
+    Compute the total row count for `query` and set it on the response headers
+
+    Args:
+        response: Response whose headers receive X-Total-Count / X-Total-Count-Mode
+        query: Filtered query, without ordering/offset/limit/eager-load options
+        table: Table name, used for planner estimates and the cache key
+        ttl: Cache time-to-live for the count (use the table's CacheTTL)
+        filters: Active filter values; any non-empty value forces an exact count
+        mode: CountMode requested by the client
+
+    Returns:
+        The count, or None when counting was skipped
+    """
+    if mode is CountMode.NONE:
+        return None
+
+    filters = filters or {}
+    effective_mode = CountMode.EXACT if _is_filtered(filters) else mode
+    cache_key = _count_cache_key(table, effective_mode.value, filters)
+
+    cached = _get_from_cache(cache_key)
+    if cached is not None:
+        total, count_mode = cached["total"], cached["mode"]
+    else:
+        total, count_mode = None, CountMode.EXACT.value
+        if effective_mode is CountMode.ESTIMATED:
+            total = _estimated_count(query, table)
+            if total is not None and total >= EXACT_COUNT_THRESHOLD:
+                count_mode = CountMode.ESTIMATED.value
+            else:
+                total = None
+        if total is None:
+            total = query.order_by(None).count()
+        _set_in_cache(cache_key, {"total": total, "mode": count_mode}, ttl)
+
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    response.headers[COUNT_MODE_HEADER] = count_mode
+    return total
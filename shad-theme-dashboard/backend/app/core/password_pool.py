@@ -0,0 +1,127 @@
+"""
+Password Hashing Pool
+Runs bcrypt in a small pool of worker processes so logins neither hold
+request threads nor compete for the GIL, sheds load with a 503 once too many
+hashes are queued, and records hash latency for /health
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from .config import settings
+from .security import bcrypt_hash_ms, bcrypt_rounds, get_password_hash, verify_password
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept for the percentiles in password_pool_stats()
+LATENCY_WINDOW = 1000
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when PASSWORD_HASH_QUEUE_LIMIT hashes are already queued or running"""
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_in_flight = 0
+_stats = {"completed": 0, "rejected": 0, "errors": 0}
+_latencies_ms: deque = deque(maxlen=LATENCY_WINDOW)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    # Created on first use so each server worker gets its own pool after forking;
+    # "spawn" keeps the children free of the parent's threads and connections
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"🔐 Password hashing pool started ({settings.PASSWORD_HASH_WORKERS} processes)")
+        return _executor
+
+
+async def _run(func: Callable, *args) -> Any:
+    global _in_flight
+    with _lock:
+        if _in_flight >= settings.PASSWORD_HASH_QUEUE_LIMIT:
+            _stats["rejected"] += 1
+            raise PasswordPoolBusy()
+        _in_flight += 1
+
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wrap_future(_get_executor().submit(func, *args))
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); start a fresh pool for the next call
+        logger.error("❌ Password hashing pool broken, restarting")
+        with _lock:
+            _stats["errors"] += 1
+        shutdown_password_pool()
+        raise
+    except Exception:
+        with _lock:
+            _stats["errors"] += 1
+        raise
+    finally:
+        with _lock:
+            _in_flight -= 1
+
+    with _lock:
+        _stats["completed"] += 1
+        _latencies_ms.append((time.perf_counter() - started) * 1000)
+    return result
+
+
+async def hash_password(password: str) -> str:
+    """get_password_hash() in the pool; raises PasswordPoolBusy when saturated"""
+    # The cost is passed along: spawned workers do not see this process's calibration
+    return await _run(get_password_hash, password, bcrypt_rounds())
+
+
+async def check_password(password: str, hashed_password: str) -> bool:
+    """verify_password() in the pool; raises PasswordPoolBusy when saturated"""
+    return await _run(verify_password, password, hashed_password)
+
+
+def _percentile(ordered, fraction: float) -> float:
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 1)
+
+
+def password_pool_stats() -> Dict[str, Any]:
+    """Pool size, queue depth, counters and latency (queue wait + hash) in ms"""
+    with _lock:
+        ordered = sorted(_latencies_ms)
+        stats = {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "bcrypt_rounds": bcrypt_rounds(),
+            "bcrypt_hash_ms": bcrypt_hash_ms(),
+            "queue_limit": settings.PASSWORD_HASH_QUEUE_LIMIT,
+            "in_flight": _in_flight,
+            **_stats,
+        }
+    if ordered:
+        stats["latency_ms"] = {
+            "p50": _percentile(ordered, 0.50),
+            "p95": _percentile(ordered, 0.95),
+            "p99": _percentile(ordered, 0.99),
+            "max": round(ordered[-1], 1),
+        }
+    return stats
+
+
+def shutdown_password_pool():
+    """Stop the worker processes"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,33 @@
+"""
+Department Permissions
+Compiles a user's department_access list into an IntFlag bitmask once, so
+per-request checks are a single AND instead of a scan of the JSON list
+"""
+
+from enum import IntFlag
+from typing import Iterable, Optional
+
+
+class Department(IntFlag):
+    # Ids match lib/permissions.ts DEPARTMENTS in the frontend
+    CLIENT_INFO = 1
+    SAMPLE_DEPARTMENT = 2
+    ORDERS = 4
+    INVENTORY = 8
+    PRODUCTION = 16
+    REPORTS = 32
+
+    @property
+    def id(self) -> str:
+        return self.name.lower()
+
+
+DEPARTMENTS_BY_ID = {department.id: department for department in Department}
+
+
+def department_mask(department_access: Optional[Iterable[str]]) -> int:
+    """Bitmask of the departments in a department_access list; unknown ids are ignored"""
+    mask = 0
+    for department_id in department_access or ():
+        mask |= DEPARTMENTS_BY_ID.get(department_id, 0)
+    return mask
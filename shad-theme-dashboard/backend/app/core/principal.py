@@ -0,0 +1,124 @@
+"""
+Authenticated Principal Cache
+Maps bearer tokens (by SHA-256) to the user facts authorization needs, so
+authenticated requests skip the users query; entries expire after a short
+TTL and are dropped in every worker when the user is updated or deleted (and all at once
+whenever the change listener resubscribes)
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .config import settings
+from .events import add_resync_hook, publish_change, subscribe
+from .permissions import Department
+
+
+@dataclass(frozen=True)
+class Principal:
+    user_id: int
+    username: str
+    is_active: bool
+    is_superuser: bool
+    department_access: List[str] = field(default_factory=list)
+    department_mask: int = 0  # Department flags compiled from department_access
+    profile: Dict[str, Any] = field(default_factory=dict)  # UserResponse fields, served by /auth/me
+
+    def can_access(self, department: Department) -> bool:
+        return self.is_superuser or bool(self.department_mask & department)
+
+    @property
+    def access_scope(self) -> str:
+        """Identifies users who are allowed the same departments (for shared response caches)"""
+        return "su" if self.is_superuser else f"d{self.department_mask}"
+
+
+def token_key(token: str) -> str:
+    """Cache key for a token; the token itself is never stored"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """Bounded LRU of token hash -> Principal with per-entry expiry"""
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                self._drop_locked(key)
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(self, key: str, principal: Principal, token_exp: Optional[float] = None):
+        """Cache a principal; `token_exp` (epoch seconds) caps the entry at the token's own expiry"""
+        ttl = self.ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._drop_locked(key)
+            self._entries[key] = (time.monotonic() + ttl, principal)
+            self._keys_by_user.setdefault(principal.user_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop_locked(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._drop_locked(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _drop_locked(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[1].user_id
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(user_id: int):
+    """Forget cached principals of a changed or deleted user in every worker (call after commit)"""
+    publish_change("principals", "invalidate", {"user_id": user_id})
+
+
+def _handle_change(action: str, data: dict):
+    if action == "invalidate":
+        principal_cache.invalidate_user(data["user_id"])
+
+
+subscribe("principals", _handle_change)
+# Invalidations published while this worker was unsubscribed are lost; start over
+add_resync_hook(principal_cache.clear)
@@ -0,0 +1,265 @@
+"""
+Pre-compressed Response Cache
+Stores rendered GET responses for hot collections in Redis together with
+gzip and brotli variants, and serves the best variant allowed by the
+request's Accept-Encoding so neither the app nor nginx recompresses them
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import brotli
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .cache import CacheTTL, get_redis_binary_client, invalidate_cache
+from .config import settings
+from .principal import principal_cache, token_key
+from .responses import negotiate_media_type
+
+logger = logging.getLogger(__name__)
+
+_API = settings.API_V1_STR
+
+# Collections whose GET responses are cached, with their time-to-live
+CACHED_PREFIXES: Dict[str, int] = {
+    f"{_API}/buyers": CacheTTL.LOOKUP_DATA,
+    f"{_API}/suppliers": CacheTTL.LOOKUP_DATA,
+    f"{_API}/materials": CacheTTL.MATERIAL_DATA,
+    f"{_API}/samples": CacheTTL.TRANSACTIONAL,
+    f"{_API}/orders": CacheTTL.TRANSACTIONAL,
+}
+
+# Writes under a prefix also invalidate collections that embed its data
+# (e.g. samples and orders carry buyer_name)
+INVALIDATES: Dict[str, Tuple[str, ...]] = {
+    f"{_API}/buyers": (f"{_API}/buyers", f"{_API}/samples", f"{_API}/orders"),
+}
+
+# Bodies smaller than this are not worth storing compressed
+MIN_CACHED_SIZE = 1024
+# Bodies larger than this are passed through uncached
+MAX_CACHED_SIZE = 32 * 1024 * 1024
+
+GZIP_LEVEL = 6        # same level nginx used to apply per request
+BROTLI_QUALITY = 5    # good ratio while keeping the one-off compression cheap
+
+# Response headers kept alongside the cached body
+STORED_HEADERS = (b"content-type", b"x-total-count", b"x-total-count-mode")
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def _match_prefix(path: str) -> Optional[str]:
+    for prefix in CACHED_PREFIXES:
+        if path == prefix or path.startswith(prefix + "/"):
+            return prefix
+    return None
+
+
+def choose_encoding(accept_encoding: str) -> str:
+    """Pick br, gzip or identity from an Accept-Encoding header"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    for coding in ("br", "gzip"):
+        if accepted.get(coding, accepted.get("*", 0)) > 0:
+            return coding
+    return "identity"
+
+
+def _cache_key(prefix: str, scope: Scope, media_type: str, access_scope: str) -> str:
+    raw = scope["path"] + "?" + scope.get("query_string", b"").decode("latin-1") + "|" + media_type + "|" + access_scope
+    return f"resp:{prefix}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def _header(scope: Scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _access_scope(scope: Scope) -> Optional[str]:
+    """
+    Cache partition for the caller, or None when the cache must be skipped
+
+    Cached bodies are served before routing, so with department checks on,
+    a body may only be reused by users with the same department access. A
+    caller whose principal is not cached yet goes through the route (and
+    its check) uncached.
+    """
+    if not settings.ENFORCE_DEPARTMENT_ACCESS:
+        return ""
+    authorization = _header(scope, b"authorization")
+    if not authorization.startswith("Bearer "):
+        return None
+    principal = principal_cache.get(token_key(authorization[len("Bearer "):]))
+    if principal is None or not principal.is_active:
+        return None
+    return principal.access_scope
+
+
+def _read_cached(key: str, encoding: str) -> Optional[Tuple[bytes, List[Tuple[bytes, bytes]]]]:
+    client = get_redis_binary_client()
+    if client is None:
+        return None
+    try:
+        headers_raw, body = client.hmget(key, "headers", encoding)
+    except Exception as e:
+        logger.error(f"❌ Response cache read error for {key}: {e}")
+        return None
+    if headers_raw is None or body is None:
+        return None
+    headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in json.loads(headers_raw)]
+    return body, headers
+
+
+def _store_compressed(key: str, body: bytes, headers: List[Tuple[bytes, bytes]], ttl: int) -> Dict[str, bytes]:
+    """Compress the body once into every variant and store them under one hash"""
+    variants = {
+        "identity": body,
+        "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL),
+        "br": brotli.compress(body, quality=BROTLI_QUALITY),
+    }
+    client = get_redis_binary_client()
+    if client is not None:
+        try:
+            stored = json.dumps([(k.decode("latin-1"), v.decode("latin-1")) for k, v in headers])
+            pipe = client.pipeline()
+            pipe.hset(key, mapping={"headers": stored, **variants})
+            pipe.expire(key, ttl)
+            pipe.execute()
+            logger.debug(f"💾 Cached response: {key} ({len(body)} B, gzip {len(variants['gzip'])} B, br {len(variants['br'])} B)")
+        except Exception as e:
+            logger.error(f"❌ Response cache write error for {key}: {e}")
+    return variants
+
+
+def invalidate_prefix(prefix: str):
+    """Drop every cached response stored under a collection prefix"""
+    for target in INVALIDATES.get(prefix, (prefix,)):
+        invalidate_cache(f"resp:{target}:*")
+
+
+class PrecompressedCacheMiddleware:
+    """
+    Serve cached, pre-compressed bodies for GET requests on CACHED_PREFIXES
+
+    Successful writes (POST/PUT/PATCH/DELETE) under a prefix invalidate its
+    cached responses. Requests sending `Cache-Control: no-cache` bypass the cache.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        prefix = _match_prefix(scope["path"])
+        method = scope["method"]
+        if prefix is None:
+            await self.app(scope, receive, send)
+        elif method in WRITE_METHODS:
+            await self._handle_write(prefix, scope, receive, send)
+        elif method == "GET" and "no-cache" not in _header(scope, b"cache-control"):
+            access_scope = _access_scope(scope)
+            if access_scope is None:
+                await self.app(scope, receive, send)
+            else:
+                await self._handle_read(prefix, access_scope, scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    async def _handle_write(self, prefix: str, scope: Scope, receive: Receive, send: Send):
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        if status_code < 400:
+            await run_in_threadpool(invalidate_prefix, prefix)
+
+    async def _handle_read(self, prefix: str, access_scope: str, scope: Scope, receive: Receive, send: Send):
+        key = _cache_key(prefix, scope, negotiate_media_type(_header(scope, b"accept")), access_scope)
+        encoding = choose_encoding(_header(scope, b"accept-encoding"))
+
+        cached = await run_in_threadpool(_read_cached, key, encoding)
+        if cached is not None:
+            body, headers = cached
+            await self._send_body(send, 200, headers, body, encoding, "HIT")
+            return
+
+        start_message: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = dict(message.get("headers", []))
+                if message["status"] != 200 or b"content-encoding" in headers or b"set-cookie" in headers:
+                    passthrough = True
+                    await send(message)
+                return
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+                if size > MAX_CACHED_SIZE:
+                    # Too large to cache: flush what we have and stream the rest
+                    passthrough = True
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": message.get("more_body", False)})
+                    return
+                if not message.get("more_body", False):
+                    await self._finish_miss(send, key, prefix, start_message, b"".join(chunks), encoding)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _finish_miss(self, send: Send, key: str, prefix: str, start_message: Message, body: bytes, encoding: str):
+        if len(body) < MIN_CACHED_SIZE:
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [(k, v) for k, v in start_message.get("headers", []) if k in STORED_HEADERS]
+        passthrough_headers = [
+            (k, v) for k, v in start_message.get("headers", [])
+            if k not in STORED_HEADERS and k != b"content-length"
+        ]
+        variants = await run_in_threadpool(_store_compressed, key, body, headers, CACHED_PREFIXES[prefix])
+        await self._send_body(send, 200, headers + passthrough_headers, variants[encoding], encoding, "MISS")
+
+    @staticmethod
+    async def _send_body(send: Send, status: int, headers: List[Tuple[bytes, bytes]], body: bytes, encoding: str, cache_status: str):
+        headers = [(k, v) for k, v in headers if k not in (b"content-length", b"content-encoding", b"vary")]
+        headers.append((b"content-length", str(len(body)).encode()))
+        headers.append((b"vary", b"Accept-Encoding"))
+        headers.append((b"x-cache", cache_status.encode()))
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
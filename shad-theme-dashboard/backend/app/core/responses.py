@@ -0,0 +1,182 @@
+"""
+Response Content Negotiation
+Serves MessagePack instead of JSON when the client asks for it with
+`Accept: application/msgpack`, using one encoder for every router, and
+builds the compact columnar body used by grid views (`?format=columns`)
+"""
+
+from contextvars import ContextVar
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Optional, Set, Type
+from uuid import UUID
+
+import msgpack
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# Media type negotiated for the request currently being handled
+_response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+
+
+def negotiate_media_type(accept: str) -> str:
+    """
+    Pick JSON or MessagePack from an Accept header
+
+    MessagePack is only chosen when it is explicitly listed with a quality at
+    least as high as JSON, so browsers sending `*/*` keep getting JSON.
+    """
+    msgpack_q = 0.0
+    json_q = 0.0
+    for item in accept.split(","):
+        media_type, _, params = item.strip().partition(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, quality)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_q = max(json_q, quality)
+
+    if msgpack_q > 0 and msgpack_q >= json_q:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode the types used by the Pydantic schemas the same way as the JSON responses"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
+
+def msgpack_encode(content: Any) -> bytes:
+    """Serialize content to MessagePack"""
+    return msgpack.packb(content, default=_msgpack_default, use_bin_type=True)
+
+
+class NegotiatedResponse(JSONResponse):
+    """JSON response that renders as MessagePack when the request negotiated it"""
+
+    def render(self, content: Any) -> bytes:
+        if _response_media_type.get() == MSGPACK_MEDIA_TYPE:
+            self.media_type = MSGPACK_MEDIA_TYPE
+            return msgpack_encode(content)
+        return super().render(content)
+
+
+class ContentNegotiationMiddleware:
+    """
+    Records the negotiated media type for the request and adds `Vary: Accept`
+
+    Plain ASGI middleware so the context variable is visible to the route
+    handler that renders the response.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept":
+                accept = value.decode("latin-1")
+                break
+
+        async def send_with_vary(message: Message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"vary", b"Accept"))
+                message["headers"] = headers
+            await send(message)
+
+        token = _response_media_type.set(negotiate_media_type(accept))
+        try:
+            await self.app(scope, receive, send_with_vary)
+        finally:
+            _response_media_type.reset(token)
+
+
+class ResponseFormat(str, Enum):
+    """Body layout of collection responses"""
+    OBJECTS = "objects"  # list of objects (default)
+    COLUMNS = "columns"  # {columns, rows, dictionaries} for grid views
+
+
+# Low-cardinality string fields sent dictionary-encoded in columnar responses
+DICTIONARY_FIELDS: Set[str] = {"sample_type", "submit_status", "order_status", "gauge"}
+
+
+def columnar_response(
+    items: Iterable[Any],
+    schema: Type[BaseModel],
+    response: Optional[Response] = None,
+    dictionary_fields: Set[str] = DICTIONARY_FIELDS,
+) -> NegotiatedResponse:
+    """
+    Render a collection as `{columns, rows, dictionaries}`
+
+    Each row is a list of values in `columns` order. Fields listed in
+    `dictionary_fields` hold an index into `dictionaries[field]` instead of
+    the repeated string (null stays null).
+
+    Args:
+        items: ORM objects (or dicts) to serialize
+        schema: Response schema used for the object form of the endpoint
+        response: Injected response whose headers (e.g. X-Total-Count) are kept
+        dictionary_fields: Fields to dictionary-encode when present in the schema
+    """
+    columns = list(schema.model_fields)
+    encoded = [(index, name) for index, name in enumerate(columns) if name in dictionary_fields]
+    dictionaries = {name: [] for _, name in encoded}
+    lookups = {name: {} for _, name in encoded}
+
+    rows = []
+    for item in items:
+        data = schema.model_validate(item).model_dump(mode="json")
+        row = [data[name] for name in columns]
+        for index, name in encoded:
+            value = row[index]
+            if value is None:
+                continue
+            lookup = lookups[name]
+            if value not in lookup:
+                lookup[value] = len(dictionaries[name])
+                dictionaries[name].append(value)
+            row[index] = lookup[value]
+        rows.append(row)
+
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+    return NegotiatedResponse(
+        content={"columns": columns, "rows": rows, "dictionaries": dictionaries},
+        headers=headers,
+    )
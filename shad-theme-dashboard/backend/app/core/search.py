@@ -0,0 +1,50 @@
+"""
+Fuzzy Text Search
+Trigram (pg_trgm) matching for the `q=` parameter of collection endpoints,
+ranked by similarity and served by the GIN indexes from
+migrations/add_trigram_search_indexes.py
+"""
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Query
+
+# Terms shorter than this have no trigrams of their own; they fall back to prefix matching
+MIN_TRIGRAM_LENGTH = 3
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_rank(q: str, *columns):
+    """Best trigram similarity of `q` to any of `columns`, 0-1"""
+    term = q.strip()
+    scores = [func.similarity(column, term) for column in columns]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
+
+
+def apply_search(query: Query, q: str, *columns) -> Query:
+    """
+    Filter `query` to rows where any of `columns` matches `q`, best match first
+
+    A row matches when a column contains the term (ILIKE) or is similar to it
+    by trigrams (the pg_trgm `%` operator, so typos still match). Both forms
+    can use a gin_trgm_ops index. Rows are ordered by their best similarity.
+
+    Args:
+        query: Base query, without ordering
+        q: Search term from the request
+        columns: String columns to search
+    """
+    term = q.strip()
+    if len(term) < MIN_TRIGRAM_LENGTH:
+        pattern = f"{_escape_like(term)}%"
+        return query.filter(or_(*[column.ilike(pattern, escape="\\") for column in columns]))
+
+    pattern = f"%{_escape_like(term)}%"
+    conditions = []
+    for column in columns:
+        conditions.append(column.ilike(pattern, escape="\\"))
+        conditions.append(column.op("%")(term))
+
+    return query.filter(or_(*conditions)).order_by(search_rank(term, *columns).desc())
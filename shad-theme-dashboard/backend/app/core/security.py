@@ -1,21 +1,143 @@
+import json
+import logging
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 import bcrypt as bcrypt_lib
+from .cache import get_redis_client
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
+# Bounds for bcrypt cost, configured or calibrated (each step doubles the hash time)
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+# Calibration result shared by all workers (per target), and the lock its measurer holds
+CALIBRATION_KEY = "bcrypt:calibration:{target_ms}"
+CALIBRATION_LOCK_TTL = 30  # seconds
+CALIBRATION_WAIT = 15      # seconds other workers wait for the result before measuring themselves
+
+# Cost for new hashes; replaced by calibrate_bcrypt_rounds() when BCRYPT_TARGET_MS is set
+_bcrypt_rounds = settings.BCRYPT_ROUNDS
+_bcrypt_hash_ms: Optional[float] = None
+_bcrypt_calibrated = False
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
     return bcrypt_lib.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    salt = bcrypt_lib.gensalt()
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
+    """Hash a password at `rounds` cost (default: the configured or calibrated cost)"""
+    salt = bcrypt_lib.gensalt(rounds or _bcrypt_rounds)
     return bcrypt_lib.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 
+def bcrypt_rounds() -> int:
+    """Cost used for new hashes"""
+    return _bcrypt_rounds
+
+
+def bcrypt_hash_ms() -> Optional[float]:
+    """Measured time of one hash at bcrypt_rounds(), once measured at startup"""
+    return _bcrypt_hash_ms
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Cost stored in a bcrypt hash ("$2b$12$..." -> 12)"""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    True when a stored hash was made at a different cost than new hashes use
+
+    With a calibrated cost, hashes one step away are kept: workers that had
+    to calibrate on their own may disagree by a step, and must not keep
+    re-hashing users back and forth.
+    """
+    stored = hash_rounds(hashed_password)
+    if stored is None:
+        return True
+    if _bcrypt_calibrated:
+        return abs(stored - _bcrypt_rounds) > 1
+    return stored != _bcrypt_rounds
+
+
+def _time_hash(rounds: int) -> float:
+    started = time.perf_counter()
+    bcrypt_lib.hashpw(b"calibration", bcrypt_lib.gensalt(rounds))
+    return (time.perf_counter() - started) * 1000
+
+
+def _measure_rounds(target_ms: int) -> Tuple[int, float]:
+    # Time the cheapest cost, then extrapolate: every extra round doubles the work
+    base_ms = _time_hash(MIN_BCRYPT_ROUNDS)
+    rounds = MIN_BCRYPT_ROUNDS
+    while rounds < MAX_BCRYPT_ROUNDS and base_ms * 2 ** (rounds + 1 - MIN_BCRYPT_ROUNDS) <= target_ms:
+        rounds += 1
+    return rounds, round(_time_hash(rounds), 1)
+
+
+def _shared_calibration(target_ms: int) -> Tuple[int, float]:
+    """One worker measures (holding a SET NX lock) and stores the result; the others read it"""
+    client = get_redis_client()
+    if client is None:
+        return _measure_rounds(target_ms)
+
+    key = CALIBRATION_KEY.format(target_ms=target_ms)
+    deadline = time.monotonic() + CALIBRATION_WAIT
+    try:
+        while True:
+            stored = client.get(key)
+            if stored:
+                result = json.loads(stored)
+                return result["rounds"], result["hash_ms"]
+            if client.set(f"{key}:lock", "1", nx=True, ex=CALIBRATION_LOCK_TTL):
+                rounds, hash_ms = _measure_rounds(target_ms)
+                client.set(key, json.dumps({"rounds": rounds, "hash_ms": hash_ms}))
+                client.delete(f"{key}:lock")
+                return rounds, hash_ms
+            if time.monotonic() > deadline:
+                break
+            time.sleep(0.2)
+    except Exception as e:
+        logger.error(f"❌ Shared bcrypt calibration failed: {e}")
+    return _measure_rounds(target_ms)
+
+
+def calibrate_bcrypt_rounds(target_ms: Optional[int] = None) -> Tuple[int, float]:
+    """
+    Measure bcrypt on this host and set the cost for new hashes
+
+    With `target_ms`, picks the highest cost (MIN_BCRYPT_ROUNDS to
+    MAX_BCRYPT_ROUNDS) whose hash takes at most that long. The first worker
+    to start measures and shares the result through Redis, so all workers
+    use the same cost (delete bcrypt:calibration:<target> to re-measure).
+    Without a target, keeps BCRYPT_ROUNDS and only measures it.
+
+    Returns:
+        (rounds, measured milliseconds per hash at that cost)
+    """
+    global _bcrypt_rounds, _bcrypt_hash_ms, _bcrypt_calibrated
+    if target_ms:
+        _bcrypt_rounds, _bcrypt_hash_ms = _shared_calibration(target_ms)
+        _bcrypt_calibrated = True
+    else:
+        _bcrypt_rounds = settings.BCRYPT_ROUNDS
+        _bcrypt_hash_ms = round(_time_hash(_bcrypt_rounds), 1)
+        _bcrypt_calibrated = False
+    logger.info(f"🔐 bcrypt cost {_bcrypt_rounds}: {_bcrypt_hash_ms} ms per hash"
+                + (f" (target {target_ms} ms)" if target_ms else ""))
+    return _bcrypt_rounds, _bcrypt_hash_ms
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
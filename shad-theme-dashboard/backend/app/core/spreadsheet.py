@@ -0,0 +1,82 @@
+"""
+Spreadsheet Import Helpers
+Streams rows from uploaded CSV or XLSX files as dicts keyed by normalized
+header names, without loading the whole sheet into memory
+"""
+
+import codecs
+import csv
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
+
+from openpyxl import load_workbook
+from pydantic import ValidationError
+
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx")
+
+
+def normalize_header(name: Any) -> str:
+    """'Number of Operation' -> 'number_of_operation'"""
+    return re.sub(r"[^0-9a-z]+", "_", str(name or "").strip().lower()).strip("_")
+
+
+def validation_message(error: ValidationError) -> str:
+    """Flatten a pydantic ValidationError into one line for a row error report"""
+    return "; ".join(f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in error.errors())
+
+
+def _is_blank(values) -> bool:
+    return all(value is None or str(value).strip() == "" for value in values)
+
+
+def _csv_rows(file: BinaryIO) -> Iterator[List[Any]]:
+    # utf-8-sig drops the BOM Excel adds when saving as CSV
+    yield from csv.reader(codecs.getreader("utf-8-sig")(file))
+
+
+def _xlsx_rows(file: BinaryIO) -> Iterator[List[Any]]:
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception as e:
+        raise ValueError(f"Could not read XLSX file: {e}")
+    try:
+        for row in workbook.worksheets[0].iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
+
+def iter_spreadsheet_rows(file: BinaryIO, filename: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yield (row_number, row) for every non-blank data row of a CSV or XLSX file
+
+    The first non-blank row is the header. row_number is the 1-based line in
+    the sheet, so error reports can point at the cell the user sees. Empty
+    strings are returned as None.
+
+    Raises:
+        ValueError: If the file type is not supported or there is no header row
+    """
+    lower = (filename or "").lower()
+    if lower.endswith(".csv"):
+        rows = _csv_rows(file)
+    elif lower.endswith(".xlsx"):
+        rows = _xlsx_rows(file)
+    else:
+        raise ValueError(f"Unsupported file type, expected one of {', '.join(SUPPORTED_EXTENSIONS)}")
+
+    header = None
+    for row_number, values in enumerate(rows, start=1):
+        if _is_blank(values):
+            continue
+        if header is None:
+            header = [normalize_header(name) for name in values]
+            continue
+        row = {}
+        for name, value in zip(header, values):
+            if name:
+                row[name] = None if isinstance(value, str) and value.strip() == "" else value
+        yield row_number, row
+
+    if header is None:
+        raise ValueError("File has no header row")
@@ -0,0 +1,178 @@
+"""
+Typeahead Prefix Index
+Per-worker sorted arrays over master-data names, searched with bisect for
+autocomplete; built once subscribed to change notifications, kept current by
+them, and rebuilt whenever the subscription is re-established
+"""
+
+import bisect
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal
+from .events import add_resync_hook, publish_change, subscribe
+from .permissions import Department
+
+logger = logging.getLogger(__name__)
+
+
+class PrefixIndex:
+    """Case-insensitive prefix lookup over (id, value) pairs; an id may have several values"""
+
+    def __init__(self):
+        self._keys: List[str] = []                 # folded values, sorted
+        self._entries: List[Tuple[int, str]] = []  # (id, original value), parallel to _keys
+        self._values_by_id: Dict[int, List[str]] = {}
+        self._journal: Optional[List[Tuple[str, int, List[str]]]] = None  # changes seen during a rebuild
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values_by_id)
+
+    @staticmethod
+    def _fold(value: str) -> str:
+        return value.strip().casefold()
+
+    def begin_rebuild(self):
+        """Record changes from now on, so build() can replay those its snapshot may predate"""
+        with self._lock:
+            self._journal = []
+
+    def build(self, items: Iterable[Tuple[int, Iterable[str]]]):
+        """Replace the whole index with `items` of (id, values)"""
+        values_by_id = {item_id: [v for v in values if v] for item_id, values in items}
+        pairs = sorted(
+            (self._fold(value), item_id, value)
+            for item_id, values in values_by_id.items()
+            for value in values
+        )
+        with self._lock:
+            self._keys = [key for key, _, _ in pairs]
+            self._entries = [(item_id, value) for _, item_id, value in pairs]
+            self._values_by_id = values_by_id
+            journal, self._journal = self._journal or [], None
+            for action, item_id, values in journal:
+                if action == "upsert":
+                    self._upsert_locked(item_id, values)
+                else:
+                    self._remove_locked(item_id)
+
+    def _remove_locked(self, item_id: int):
+        for value in self._values_by_id.pop(item_id, []):
+            key = self._fold(value)
+            position = bisect.bisect_left(self._keys, key)
+            while position < len(self._keys) and self._keys[position] == key:
+                if self._entries[position][0] == item_id:
+                    del self._keys[position]
+                    del self._entries[position]
+                    break
+                position += 1
+
+    def _upsert_locked(self, item_id: int, values: List[str]):
+        self._remove_locked(item_id)
+        for value in values:
+            key = self._fold(value)
+            position = bisect.bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self._entries.insert(position, (item_id, value))
+        self._values_by_id[item_id] = values
+
+    def upsert(self, item_id: int, values: Iterable[str]):
+        """Add an id or replace its values"""
+        values = [v for v in values if v]
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append(("upsert", item_id, values))
+            self._upsert_locked(item_id, values)
+
+    def remove(self, item_id: int):
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append(("delete", item_id, []))
+            self._remove_locked(item_id)
+
+    def search(self, prefix: str, limit: int = 10) -> List[Dict[str, object]]:
+        """Up to `limit` ids whose values start with `prefix`, alphabetically, one match per id"""
+        key = self._fold(prefix)
+        matches: List[Dict[str, object]] = []
+        seen = set()
+        with self._lock:
+            position = bisect.bisect_left(self._keys, key)
+            while position < len(self._keys) and len(matches) < limit:
+                if not self._keys[position].startswith(key):
+                    break
+                item_id, value = self._entries[position]
+                if item_id not in seen:
+                    seen.add(item_id)
+                    matches.append({"id": item_id, "value": value})
+                position += 1
+        return matches
+
+
+def _sources():
+    # Imported lazily: models import the core package
+    from ..models import Buyer, MaterialMaster, OperationType, StyleSummary
+    return {
+        "materials": (MaterialMaster.id, [MaterialMaster.material_name]),
+        "buyers": (Buyer.id, [Buyer.buyer_name]),
+        "styles": (StyleSummary.id, [StyleSummary.style_id, StyleSummary.style_name]),
+        "operation-types": (OperationType.id, [OperationType.operation_name]),
+    }
+
+
+TYPEAHEAD_ENTITIES = ("materials", "buyers", "styles", "operation-types")
+
+# Department whose users may look up each entity
+TYPEAHEAD_DEPARTMENTS: Dict[str, Department] = {
+    "materials": Department.SAMPLE_DEPARTMENT,
+    "buyers": Department.CLIENT_INFO,
+    "styles": Department.SAMPLE_DEPARTMENT,
+    "operation-types": Department.SAMPLE_DEPARTMENT,
+}
+
+indexes: Dict[str, PrefixIndex] = {entity: PrefixIndex() for entity in TYPEAHEAD_ENTITIES}
+
+
+def build_indexes(db: Session):
+    """Load every typeahead index from the database (one query per entity)"""
+    for entity, (id_column, value_columns) in _sources().items():
+        indexes[entity].begin_rebuild()
+        rows = db.query(id_column, *value_columns).all()
+        indexes[entity].build((row[0], row[1:]) for row in rows)
+        logger.info(f"🔎 Typeahead index '{entity}': {len(indexes[entity])} entries")
+
+
+def notify_upsert(entity: str, item_id: int, *values: str):
+    """Record a created or renamed item in every worker's index (call after commit)"""
+    publish_change(f"typeahead:{entity}", "upsert", {"id": item_id, "values": list(values)})
+
+
+def notify_delete(entity: str, item_id: int):
+    """Drop a deleted item from every worker's index (call after commit)"""
+    publish_change(f"typeahead:{entity}", "delete", {"id": item_id})
+
+
+def _make_handler(index: PrefixIndex):
+    def handle(action: str, data: dict):
+        if action == "upsert":
+            index.upsert(data["id"], data["values"])
+        elif action == "delete":
+            index.remove(data["id"])
+    return handle
+
+
+def _resync():
+    # Runs in the listener thread after each (re)subscribe: changes sent while unsubscribed were missed
+    db = SessionLocal()
+    try:
+        build_indexes(db)
+    finally:
+        db.close()
+
+
+for _entity, _index in indexes.items():
+    subscribe(f"typeahead:{_entity}", _make_handler(_index))
+add_resync_hook(_resync)
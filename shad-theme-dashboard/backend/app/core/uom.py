@@ -0,0 +1,56 @@
+"""
+Unit of Measurement Conversion
+Server-side copy of the conversion table in the frontend's lib/uom-units.ts,
+so converted consumption values are computed the same way on both sides
+"""
+
+from typing import Dict, Optional, Tuple
+
+# UOM -> (base unit, factor to base unit)
+UOM_CONVERSIONS: Dict[str, Tuple[str, float]] = {
+    # Length conversions (base: Meter)
+    "Meter (M)": ("Meter (M)", 1),
+    "Centimeter (CM)": ("Meter (M)", 0.01),
+    "Kilometer (KM)": ("Meter (M)", 1000),
+    "Yard (YD)": ("Meter (M)", 0.9144),
+    "Inch (IN)": ("Meter (M)", 0.0254),
+    "Foot (FT)": ("Meter (M)", 0.3048),
+
+    # Weight conversions (base: Kilogram)
+    "Kilogram (KG)": ("Kilogram (KG)", 1),
+    "Gram (G)": ("Kilogram (KG)", 0.001),
+    "Milligram (MG)": ("Kilogram (KG)", 0.000001),
+    "Metric Ton (MT)": ("Kilogram (KG)", 1000),
+    "Pound (LB)": ("Kilogram (KG)", 0.453592),
+    "Ounce (OZ)": ("Kilogram (KG)", 0.0283495),
+
+    # Area conversions (base: Square Meter)
+    "Square Meter (M²)": ("Square Meter (M²)", 1),
+    "Square Centimeter (CM²)": ("Square Meter (M²)", 0.0001),
+    "Square Yard (YD²)": ("Square Meter (M²)", 0.836127),
+
+    # Volume conversions (base: Liter)
+    "Liter (L)": ("Liter (L)", 1),
+    "Milliliter (ML)": ("Liter (L)", 0.001),
+    "Cubic Meter (M³)": ("Liter (L)", 1000),
+    "Gallon (GAL)": ("Liter (L)", 3.78541),
+
+    # Quantity conversions (base: Piece)
+    "Piece (Pcs)": ("Piece (Pcs)", 1),
+    "Dozen (DZN)": ("Piece (Pcs)", 12),
+    "Gross (GRO)": ("Piece (Pcs)", 144),
+    "Great Gross (GG)": ("Piece (Pcs)", 1728),
+}
+
+
+def convert_uom(value: float, from_uom: str, to_uom: str) -> Optional[float]:
+    """
+    Convert a value between two units sharing the same base unit
+
+    Returns None when either unit is unknown or the units are incompatible.
+    """
+    source = UOM_CONVERSIONS.get(from_uom)
+    target = UOM_CONVERSIONS.get(to_uom)
+    if source is None or target is None or source[0] != target[0]:
+        return None
+    return value * source[1] / target[1]
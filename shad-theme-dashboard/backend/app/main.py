@@ -2,8 +2,15 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from .core import settings, init_db
-from .api import auth, buyers, suppliers, samples, operations, orders, contacts, health, materials, users
+from .api import auth, buyers, suppliers, samples, operations, orders, contacts, health, materials, users, exports, autocomplete, search
 from .core.logging import setup_logging
+from .core.responses import NegotiatedResponse, ContentNegotiationMiddleware
+from .core.response_cache import PrecompressedCacheMiddleware
+from .core import events, typeahead
+from .core.password_pool import shutdown_password_pool
+from .core.security import calibrate_bcrypt_rounds
+from .core.limiter import limiter, rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 import traceback
 
 # Configure logging
@@ -13,10 +20,24 @@ logger = setup_logging()
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=NegotiatedResponse
 )
 
 
+# Per-user/per-IP rate limits on login, bulk imports and exports (counted in Redis)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+
+
+# Serve hot collections from Redis with stored gzip/brotli variants
+app.add_middleware(PrecompressedCacheMiddleware)
+
+
+# Serve MessagePack to clients sending Accept: application/msgpack
+app.add_middleware(ContentNegotiationMiddleware)
+
+
 # Set up CORS - Allow all origins for internal ERP
 app.add_middleware(
     CORSMiddleware,
@@ -24,6 +45,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Total-Count-Mode", "Retry-After"],
 )
 
 
@@ -67,6 +89,26 @@ async def startup_event():
     finally:
         db.close()
 
+    # Subscribe to change notifications before loading in-memory indexes, so no
+    # change is missed in between; once subscribed, the resync hooks build them
+    events.start_listener()
+    if not events.is_subscribed():
+        db = SessionLocal()
+        try:
+            typeahead.build_indexes(db)
+        finally:
+            db.close()
+
+    # Measure bcrypt here and, with BCRYPT_TARGET_MS, pick the cost for new hashes
+    calibrate_bcrypt_rounds(settings.BCRYPT_TARGET_MS)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background listeners and worker processes"""
+    events.stop_listener()
+    shutdown_password_pool()
+
 
 @app.get("/")
 async def root():
@@ -88,3 +130,6 @@ app.include_router(contacts.router, prefix=f"{settings.API_V1_STR}/contacts", ta
 app.include_router(materials.router, prefix=f"{settings.API_V1_STR}", tags=["materials"])
 app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["users"])
 app.include_router(health.router, prefix=f"{settings.API_V1_STR}", tags=["health"])
+app.include_router(exports.router, prefix=f"{settings.API_V1_STR}/exports", tags=["exports"])
+app.include_router(autocomplete.router, prefix=f"{settings.API_V1_STR}/autocomplete", tags=["autocomplete"])
+app.include_router(search.router, prefix=f"{settings.API_V1_STR}/search", tags=["search"])
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -176,6 +176,11 @@ class SampleTNA(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Upsert key: one TNA row per sample and set piece (NULL piece = whole sample)
+    __table_args__ = (
+        Index("uq_sample_tna_sample_piece", sample_id, func.coalesce(piece_name, ""), unique=True),
+    )
+
 
 class SamplePlan(Base):
     __tablename__ = "sample_plan"
@@ -201,6 +206,11 @@ class SamplePlan(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Upsert key: one plan row per sample and set piece (NULL piece = whole sample)
+    __table_args__ = (
+        Index("uq_sample_plan_sample_piece", sample_id, func.coalesce(piece_name, ""), unique=True),
+    )
+
 
 class OperationType(Base):
     __tablename__ = "operation_types"
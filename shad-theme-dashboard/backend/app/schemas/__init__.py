@@ -9,16 +9,21 @@ from .sample import (
     StyleSummaryCreate, StyleSummaryResponse,
     StyleVariantCreate, StyleVariantResponse, StyleVariantUpdate,
     VariantColorPartBase, VariantColorPartCreate, VariantColorPartResponse,
-    RequiredMaterialCreate, RequiredMaterialResponse, RequiredMaterialUpdate,
-    SampleCreate, SampleResponse, SampleUpdate,
-    SampleOperationCreate, SampleOperationResponse,
+    RequiredMaterialCreate, RequiredMaterialResponse, RequiredMaterialUpdate, RequiredMaterialLine,
+    StyleSheetVariant, StyleSheetResponse, StyleCloneRequest,
+    VariantColourway, VariantMatrixRequest, VariantMatrixResult,
+    SampleCreate, SampleResponse, SampleUpdate, SampleBulkResult, SampleStatusTransition, FacetCount, SampleFacets,
+    SampleOperationCreate, SampleOperationResponse, SampleOperationImportResult,
     SampleTNACreate, SampleTNAResponse, SampleTNAUpdate,
     SamplePlanCreate, SamplePlanResponse,
     OperationTypeCreate, OperationTypeResponse,
     SMVCalculationCreate, SMVCalculationResponse
 )
 from .supplier import SupplierCreate, SupplierResponse, SupplierUpdate
-from .order import OrderCreate, OrderUpdate, OrderResponse
+from .order import OrderCreate, OrderUpdate, OrderResponse, OrderImportResult
+from .bulk import BulkRowError, BatchResult
+from .autocomplete import TypeaheadMatch
+from .search import TextSearchHit, GlobalSearchHit, SearchSourceStatus, GlobalSearchResponse
 
 __all__ = [
     "UserCreate", "UserResponse", "UserUpdate", "Token", "LoginRequest",
@@ -29,13 +34,18 @@ __all__ = [
     "StyleSummaryCreate", "StyleSummaryResponse",
     "StyleVariantCreate", "StyleVariantResponse", "StyleVariantUpdate",
     "VariantColorPartBase", "VariantColorPartCreate", "VariantColorPartResponse",
-    "RequiredMaterialCreate", "RequiredMaterialResponse", "RequiredMaterialUpdate",
-    "SampleCreate", "SampleResponse", "SampleUpdate",
-    "SampleOperationCreate", "SampleOperationResponse",
+    "RequiredMaterialCreate", "RequiredMaterialResponse", "RequiredMaterialUpdate", "RequiredMaterialLine",
+    "StyleSheetVariant", "StyleSheetResponse", "StyleCloneRequest",
+    "VariantColourway", "VariantMatrixRequest", "VariantMatrixResult",
+    "SampleCreate", "SampleResponse", "SampleUpdate", "SampleBulkResult", "SampleStatusTransition",
+    "FacetCount", "SampleFacets",
+    "SampleOperationCreate", "SampleOperationResponse", "SampleOperationImportResult",
     "SampleTNACreate", "SampleTNAResponse", "SampleTNAUpdate",
     "SamplePlanCreate", "SamplePlanResponse",
     "OperationTypeCreate", "OperationTypeResponse",
     "SMVCalculationCreate", "SMVCalculationResponse",
     "SupplierCreate", "SupplierResponse", "SupplierUpdate",
-    "OrderCreate", "OrderUpdate", "OrderResponse",
+    "OrderCreate", "OrderUpdate", "OrderResponse", "OrderImportResult",
+    "BulkRowError", "BatchResult",
+    "TypeaheadMatch", "TextSearchHit", "GlobalSearchHit", "SearchSourceStatus", "GlobalSearchResponse",
 ]
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class TypeaheadMatch(BaseModel):
+    id: int
+    value: str  # the name or code that matched the prefix
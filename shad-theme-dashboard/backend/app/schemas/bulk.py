@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BulkRowError(BaseModel):
+    """A row rejected by a bulk endpoint; the rest of the batch is still applied"""
+    index: int  # 0-based position in the submitted batch
+    key: Optional[str] = None  # natural key of the row (e.g. sample_id), if known
+    row: Optional[int] = None  # 1-based line in the uploaded file, for file imports
+    error: str
+
+
+class BatchResult(BaseModel, Generic[T]):
+    """Rows returned by a `/batch?ids=` lookup, in request order"""
+    items: List[T]
+    missing: List[int] = []  # requested ids that do not exist
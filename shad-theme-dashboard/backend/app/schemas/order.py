@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from .bulk import BulkRowError
 
 
 # Order Create Schema
@@ -93,3 +94,14 @@ class OrderResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Order Import Report Schema
+class OrderImportResult(BaseModel):
+    dry_run: bool
+    total_rows: int  # data rows read from the file
+    created: int  # orders inserted (or that would be, for a dry run)
+    failed: int  # rows rejected, see errors
+    order_quantity: int  # sum of order_quantity over created rows
+    total_value: float  # sum of total_value over created rows
+    errors: List[BulkRowError] = []
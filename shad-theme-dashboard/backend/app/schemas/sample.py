@@ -1,6 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Union
 from datetime import datetime
+from .bulk import BulkRowError
 
 
 class StyleSummaryBase(BaseModel):
@@ -76,6 +77,25 @@ class SampleResponse(SampleBase):
         from_attributes = True
 
 
+class SampleBulkResult(BaseModel):
+    created: List[SampleResponse]
+    errors: List[BulkRowError] = []
+
+
+class SampleStatusTransition(BaseModel):
+    ids: List[int] = Field(..., min_length=1)
+    submit_status: str
+
+
+class FacetCount(BaseModel):
+    value: Optional[Union[int, str]] = None  # None counts samples with the field unset
+    count: int
+
+
+class SampleFacets(BaseModel):
+    total: int  # samples matching every active filter
+    facets: Dict[str, List[FacetCount]]  # field -> counts, ignoring that field's own filter
+
 
 class SampleOperationBase(BaseModel):
     sample_id: int
@@ -99,6 +119,12 @@ class SampleOperationResponse(SampleOperationBase):
         from_attributes = True
 
 
+class SampleOperationImportResult(BaseModel):
+    total_rows: int
+    created: int
+    errors: List[BulkRowError] = []
+
+
 class SampleTNABase(BaseModel):
     sample_id: str
     buyer_name: str
@@ -346,3 +372,47 @@ class RequiredMaterialResponse(RequiredMaterialBase):
 
     class Config:
         from_attributes = True
+
+
+class VariantColourway(BaseModel):
+    colour_name: str
+    colour_code: Optional[str] = None
+    color_parts: Optional[List[VariantColorPartBase]] = None  # makes the colourway multi-color
+
+
+class VariantMatrixRequest(BaseModel):
+    """Colourways x set pieces to generate; every variant gets the same size run"""
+    colourways: List[VariantColourway] = Field(..., min_length=1)
+    sizes: List[str] = []
+    pieces: List[str] = []  # set piece names, only for set styles
+
+
+class VariantMatrixResult(BaseModel):
+    created: List[StyleVariantResponse]
+    skipped: List[str] = []  # display names of combinations that already existed
+
+
+class StyleCloneRequest(BaseModel):
+    style_id: str  # style code of the copy, must be unique
+    style_name: Optional[str] = None  # defaults to the source style's name
+    buyer_id: Optional[int] = None  # defaults to the source style's buyer
+
+
+class StyleSheetVariant(StyleVariantResponse):
+    materials: List[RequiredMaterialResponse] = []
+
+
+class StyleSheetResponse(StyleSummaryResponse):
+    """A style with its variants (color parts, materials) and samples, as one document"""
+    variants: List[StyleSheetVariant] = []
+    samples: List[SampleResponse] = []
+
+
+class RequiredMaterialLine(BaseModel):
+    """One row of a variant's full material list; rows without id are created"""
+    id: Optional[int] = None
+    material: str
+    uom: str
+    consumption_per_piece: float
+    converted_uom: Optional[str] = None
+    remarks: Optional[str] = None
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+
+class TextSearchHit(BaseModel):
+    entity: str  # samples, styles, orders or materials
+    id: int
+    label: Optional[str] = None  # sample_id, style_name, order_no or material
+    rank: float
+    snippet: str  # matching text with terms wrapped in <mark></mark>
+
+
+class GlobalSearchHit(BaseModel):
+    entity: str  # buyers, suppliers, styles, samples, orders or materials
+    id: int
+    label: Optional[str] = None
+    detail: Optional[str] = None  # company, style code, sample type, ...
+    score: float  # trigram similarity, 0-1
+
+
+class SearchSourceStatus(BaseModel):
+    status: str  # ok, timeout or error
+    count: int
+    elapsed_ms: Optional[int] = None
+
+
+class GlobalSearchResponse(BaseModel):
+    items: List[GlobalSearchHit]
+    sources: Dict[str, SearchSourceStatus]  # partial results when any source is not "ok"
@@ -0,0 +1,68 @@
+"""
+Benchmark login throughput against a running API
+
+Fires CONCURRENCY simultaneous POST /api/v1/auth/login requests (100 by
+default, like a shift start) and reports throughput, latency percentiles and
+status codes, including logins shed with 503 by the password hashing pool.
+
+Usage:
+    python benchmark_login.py --url http://localhost:8000 --username admin --password admin
+"""
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def login(url: str, username: str, password: str):
+    body = json.dumps({"username": username, "password": password}).encode("utf-8")
+    request = urllib.request.Request(
+        f"{url}/api/v1/auth/login", data=body, headers={"Content-Type": "application/json"}
+    )
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = "error"
+    return status, (time.perf_counter() - started) * 1000
+
+
+def percentile(ordered, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent logins")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3, help="Waves of CONCURRENCY logins")
+    args = parser.parse_args()
+
+    total = args.concurrency * args.rounds
+    print(f"Logging in {total} times, {args.concurrency} at a time, against {args.url}...")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda _: login(args.url, args.username, args.password), range(total)))
+    elapsed = time.perf_counter() - started
+
+    statuses = Counter(status for status, _ in results)
+    ordered = sorted(ms for _, ms in results)
+    print(f"\nCompleted in {elapsed:.2f}s: {total / elapsed:.1f} logins/s")
+    print(f"Latency ms: p50={percentile(ordered, 0.50):.0f} p95={percentile(ordered, 0.95):.0f} "
+          f"p99={percentile(ordered, 0.99):.0f} max={ordered[-1]:.0f}")
+    print("Status codes: " + ", ".join(f"{status}={count}" for status, count in sorted(statuses.items(), key=str)))
+    if statuses.get(503):
+        print("503s are logins shed by PASSWORD_HASH_QUEUE_LIMIT; clients retry after Retry-After")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Export analytical tables to Arrow IPC / Parquet files
+
+Usage:
+    python export_tables.py                              # all tables, parquet, ./exports
+    python export_tables.py samples order_management --format arrow --output-dir /data
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import time
+from app.core.database import SessionLocal
+from app.core.export import EXPORT_TABLES, DEFAULT_BATCH_SIZE, ExportFormat, write_export
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export ERP tables to Arrow IPC or Parquet")
+    parser.add_argument("tables", nargs="*", metavar="TABLE",
+                        help=f"Tables to export (default: all of {', '.join(sorted(EXPORT_TABLES))})")
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat], default=ExportFormat.PARQUET.value)
+    parser.add_argument("--output-dir", default="exports")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    export_format = ExportFormat(args.format)
+    tables = args.tables or sorted(EXPORT_TABLES)
+    unknown = [t for t in tables if t not in EXPORT_TABLES]
+    if unknown:
+        parser.error(f"not exportable: {', '.join(unknown)}")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    db = SessionLocal()
+    try:
+        for table_name in tables:
+            path = os.path.join(args.output_dir, f"{table_name}.{export_format.extension}")
+            start = time.time()
+            with open(path, "wb") as sink:
+                rows = write_export(db, table_name, sink, export_format, args.batch_size)
+            print(f"✓ {table_name}: {rows} rows -> {path} ({time.time() - start:.1f}s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Database migration to add full-text search over notes and descriptions.
+
+For each table in app.core.fulltext.FULLTEXT_SOURCES (samples, style_summaries,
+order_management, required_materials) this:
+  1. Adds a nullable search_vector tsvector column (no table rewrite)
+  2. Installs a trigger keeping it current on INSERT and on UPDATE of the
+     source columns
+  3. Backfills existing rows in batches, each committed on its own, so no
+     long-running transaction holds row locks
+  4. Builds a GIN index with CREATE INDEX CONCURRENTLY
+
+The column is filled by a trigger rather than declared GENERATED ALWAYS AS
+... STORED because adding a generated column rewrites the whole table under
+an exclusive lock, which cannot be batched.
+
+Run this migration with:
+python backend/migrations/add_fulltext_search.py
+"""
+
+import sys
+import os
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.core.database import engine
+from app.core.fulltext import FULLTEXT_SOURCES, VECTOR_COLUMN, vector_sql
+
+# Rows updated per backfill transaction
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _index_name(table: str) -> str:
+    return f"ix_{table}_{VECTOR_COLUMN}"
+
+
+def run_migration():
+    """Run the migration to add the full-text search columns"""
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        print("Starting migration: Adding full-text search...")
+
+        try:
+            for step, source in enumerate(FULLTEXT_SOURCES.values(), start=1):
+                table = source.table
+                function = f"{table}_{VECTOR_COLUMN}_update"
+                watched = ", ".join(column for column, _ in source.columns)
+                print(f"{step}. {table} ({watched})")
+
+                print(f"   Adding {VECTOR_COLUMN} column...")
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {VECTOR_COLUMN} tsvector;"))
+
+                print("   Installing trigger...")
+                conn.execute(text(f"""
+                    CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+                    BEGIN
+                        NEW.{VECTOR_COLUMN} := {vector_sql(source, row="NEW.")};
+                        RETURN NEW;
+                    END
+                    $$ LANGUAGE plpgsql;
+                """))
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {function} ON {table};"))
+                conn.execute(text(f"""
+                    CREATE TRIGGER {function}
+                    BEFORE INSERT OR UPDATE OF {watched} ON {table}
+                    FOR EACH ROW EXECUTE FUNCTION {function}();
+                """))
+
+                # Rows with no text get an empty (not NULL) vector, so the loop ends
+                backfilled = 0
+                while True:
+                    result = conn.execute(text(f"""
+                        UPDATE {table} SET {VECTOR_COLUMN} = {vector_sql(source)}
+                        WHERE id IN (
+                            SELECT id FROM {table} WHERE {VECTOR_COLUMN} IS NULL
+                            ORDER BY id LIMIT :batch_size
+                        );
+                    """), {"batch_size": BACKFILL_BATCH_SIZE})
+                    if result.rowcount == 0:
+                        break
+                    backfilled += result.rowcount
+                    print(f"   Backfilled {backfilled} rows...")
+
+                index_name = _index_name(table)
+                # A failed concurrent build leaves an INVALID index behind; drop it so it is rebuilt
+                invalid = conn.execute(text("""
+                    SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE c.relname = :name AND NOT i.indisvalid
+                """), {"name": index_name}).first()
+                if invalid:
+                    print(f"   Dropping invalid index {index_name} from an earlier run...")
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};"))
+
+                print(f"   Creating {index_name}...")
+                conn.execute(text(f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                    ON {table} USING gin ({VECTOR_COLUMN});
+                """))
+
+            print("\n✅ Migration completed successfully!")
+            print("\nChanges made:")
+            for source in FULLTEXT_SOURCES.values():
+                print(f"  - {source.table}: {VECTOR_COLUMN} column, trigger and GIN index {_index_name(source.table)}")
+
+        except Exception as e:
+            print(f"\n❌ Migration failed: {str(e)}")
+            raise
+
+
+def verify_migration():
+    """Verify that the migration was successful"""
+
+    with engine.connect() as conn:
+        print("\nVerifying migration...")
+
+        expected = {_index_name(source.table) for source in FULLTEXT_SOURCES.values()}
+        result = conn.execute(text("""
+            SELECT c.relname
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = ANY(:names) AND i.indisvalid;
+        """), {"names": list(expected)})
+        found = {row[0] for row in result}
+
+        pending = 0
+        for source in FULLTEXT_SOURCES.values():
+            pending += conn.execute(text(
+                f"SELECT count(*) FROM {source.table} WHERE {VECTOR_COLUMN} IS NULL"
+            )).scalar()
+
+        if found == expected and pending == 0:
+            print("\n✅ Full-text search indexes found and all rows backfilled:")
+            for index_name in sorted(expected):
+                print(f"  - {index_name}")
+        else:
+            missing = ", ".join(sorted(expected - found)) or "none"
+            print(f"\n⚠️  Warning: missing indexes: {missing}; rows not backfilled: {pending}")
+
+
+if __name__ == "__main__":
+    try:
+        run_migration()
+        verify_migration()
+    except Exception as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
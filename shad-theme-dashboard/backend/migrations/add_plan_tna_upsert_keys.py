@@ -0,0 +1,99 @@
+"""
+Database migration to add (sample_id, piece_name) upsert keys to sample_plan and sample_tna.
+
+Bulk plan/TNA saves use INSERT ... ON CONFLICT DO UPDATE, which needs a
+unique index on the key. piece_name is NULL for non-set samples, so the
+index is on (sample_id, COALESCE(piece_name, '')).
+
+Existing duplicates are removed first, keeping the most recent row.
+
+Run this migration with:
+python backend/migrations/add_plan_tna_upsert_keys.py
+"""
+
+import sys
+import os
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.core.database import engine
+
+TABLES = {
+    "sample_plan": "uq_sample_plan_sample_piece",
+    "sample_tna": "uq_sample_tna_sample_piece",
+}
+
+
+def run_migration():
+    """Run the migration to add the upsert keys"""
+
+    with engine.connect() as conn:
+        print("Starting migration: Adding (sample_id, piece_name) upsert keys...")
+
+        try:
+            # Start a transaction
+            trans = conn.begin()
+
+            for step, (table, index_name) in enumerate(TABLES.items(), start=1):
+                print(f"{step}a. Removing duplicate {table} rows (keeping the latest)...")
+                result = conn.execute(text(f"""
+                    DELETE FROM {table} t
+                    USING {table} newer
+                    WHERE t.sample_id = newer.sample_id
+                    AND COALESCE(t.piece_name, '') = COALESCE(newer.piece_name, '')
+                    AND t.id < newer.id;
+                """))
+                print(f"   Removed {result.rowcount} duplicate row(s)")
+
+                print(f"{step}b. Creating unique index {index_name}...")
+                conn.execute(text(f"""
+                    CREATE UNIQUE INDEX IF NOT EXISTS {index_name}
+                    ON {table} (sample_id, (COALESCE(piece_name, '')));
+                """))
+
+            # Commit the transaction
+            trans.commit()
+
+            print("\n✅ Migration completed successfully!")
+            print("\nChanges made:")
+            for table, index_name in TABLES.items():
+                print(f"  - {table}: unique index {index_name} on (sample_id, COALESCE(piece_name, ''))")
+
+        except Exception as e:
+            trans.rollback()
+            print(f"\n❌ Migration failed: {str(e)}")
+            raise
+
+
+def verify_migration():
+    """Verify that the migration was successful"""
+
+    with engine.connect() as conn:
+        print("\nVerifying migration...")
+
+        result = conn.execute(text("""
+            SELECT tablename, indexname
+            FROM pg_indexes
+            WHERE indexname IN ('uq_sample_plan_sample_piece', 'uq_sample_tna_sample_piece');
+        """))
+
+        indexes = list(result)
+        if len(indexes) == len(TABLES):
+            print("\n✅ Upsert indexes found:")
+            for row in indexes:
+                print(f"  - {row[0]}: {row[1]}")
+        else:
+            print("\n⚠️  Warning: upsert indexes missing")
+
+
+if __name__ == "__main__":
+    try:
+        run_migration()
+        verify_migration()
+    except Exception as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
@@ -0,0 +1,102 @@
+"""
+Database migration to add pg_trgm GIN indexes for the q= search parameter.
+
+Enables the pg_trgm extension and builds trigram indexes on the columns
+searched by the buyers, suppliers, styles, samples and materials lists
+and by the global search (GET /search, which also covers order numbers).
+Indexes are built with CREATE INDEX CONCURRENTLY so the tables stay
+writable; that cannot run inside a transaction, so each statement is
+executed in autocommit mode.
+
+Run this migration with:
+python backend/migrations/add_trigram_search_indexes.py
+"""
+
+import sys
+import os
+from pathlib import Path
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.core.database import engine
+
+# index name -> (table, column)
+INDEXES = {
+    "ix_buyers_buyer_name_trgm": ("buyers", "buyer_name"),
+    "ix_suppliers_supplier_name_trgm": ("suppliers", "supplier_name"),
+    "ix_style_summaries_style_name_trgm": ("style_summaries", "style_name"),
+    "ix_style_summaries_style_id_trgm": ("style_summaries", "style_id"),
+    "ix_samples_sample_id_trgm": ("samples", "sample_id"),
+    "ix_material_master_material_name_trgm": ("material_master", "material_name"),
+    "ix_order_management_order_no_trgm": ("order_management", "order_no"),
+}
+
+
+def run_migration():
+    """Run the migration to add the trigram indexes"""
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        print("Starting migration: Adding trigram search indexes...")
+
+        try:
+            print("1. Enabling pg_trgm extension...")
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+
+            for step, (index_name, (table, column)) in enumerate(INDEXES.items(), start=2):
+                # A failed concurrent build leaves an INVALID index behind; drop it so it is rebuilt
+                invalid = conn.execute(text("""
+                    SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE c.relname = :name AND NOT i.indisvalid
+                """), {"name": index_name}).first()
+                if invalid:
+                    print(f"   Dropping invalid index {index_name} from an earlier run...")
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};"))
+
+                print(f"{step}. Creating {index_name} on {table}({column})...")
+                conn.execute(text(f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                    ON {table} USING gin ({column} gin_trgm_ops);
+                """))
+
+            print("\n✅ Migration completed successfully!")
+            print("\nChanges made:")
+            print("  - Enabled pg_trgm extension")
+            for index_name, (table, column) in INDEXES.items():
+                print(f"  - {table}: GIN trigram index {index_name} on {column}")
+
+        except Exception as e:
+            print(f"\n❌ Migration failed: {str(e)}")
+            raise
+
+
+def verify_migration():
+    """Verify that the migration was successful"""
+
+    with engine.connect() as conn:
+        print("\nVerifying migration...")
+
+        result = conn.execute(text("""
+            SELECT c.relname
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = ANY(:names) AND i.indisvalid;
+        """), {"names": list(INDEXES)})
+
+        found = {row[0] for row in result}
+        if found == set(INDEXES):
+            print("\n✅ Trigram indexes found:")
+            for index_name in INDEXES:
+                print(f"  - {index_name}")
+        else:
+            print(f"\n⚠️  Warning: missing trigram indexes: {', '.join(sorted(set(INDEXES) - found))}")
+
+
+if __name__ == "__main__":
+    try:
+        run_migration()
+        verify_migration()
+    except Exception as e:
+        print(f"\nError: {e}")
+        sys.exit(1)